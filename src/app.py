@@ -6,11 +6,10 @@ Professional Web Application
 import streamlit as st
 import tempfile
 import os
-import json
 from datetime import datetime
-from parser import parse_ifc
+from parser import parse_ifc, RULE_BOUNDARY_TYPES
 from geometry import check_multiple_spaces
-from rules import BFS2024ComplianceChecker, generate_compliance_report
+from rules import BFS2024ComplianceChecker, generate_compliance_report, dumps_json
 
 # Page configuration
 st.set_page_config(
@@ -334,7 +333,9 @@ if uploaded_file:
                     status = st.empty()
                     
                     status.info(f"📖 {t('parsing')}")
-                    parsed = parse_ifc(tmp_path)
+                    parsed = parse_ifc(
+                        tmp_path, boundary_types=RULE_BOUNDARY_TYPES, memoize=False
+                    )
                     spaces = parsed.get("spaces", [])
                     
                     if not spaces:
@@ -346,11 +347,9 @@ if uploaded_file:
                     
                     status.info(f"✓ {t('compliance_check')}")
                     checker = BFS2024ComplianceChecker()
-                    compliance_results = []
-                    
-                    for i, space in enumerate(spaces):
-                        result = checker.check_compliance(space, geometry_results[i])
-                        compliance_results.append(result)
+                    compliance_results = checker.check_compliance_batch(
+                        spaces, geometry_results
+                    )
                     
                     status.success(f"✓ {t('complete')}")
                     
@@ -461,12 +460,12 @@ if st.session_state.results:
             "file": st.session_state.processed_file,
             "timestamp": datetime.now().isoformat(),
             "language": st.session_state.language,
-            "results": [r.to_dict() for r in results]
+            "results": results
         }
         
         st.download_button(
             label=f"📄 {t('download_json')}",
-            data=json.dumps(json_data, indent=2, ensure_ascii=False),
+            data=dumps_json(json_data, indent=True),
             file_name=f"nodal_compliance_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
             mime="application/json",
             use_container_width=True
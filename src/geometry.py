@@ -3,12 +3,52 @@ NODAL Geometry Checking Module
 Validates accessibility requirements for spaces
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
+import shapely
 from shapely.geometry import Point, Polygon
 from shapely.ops import nearest_points
 import numpy as np
 from typing import Dict, List, Tuple, Optional
 
 
+# Circles are buffered points: polygons inscribed in the circle with this
+# many segments per quarter (Shapely's Point.buffer default).  A center
+# whose distance to the boundary exceeds the radius always fits; one closer
+# than the polygon's inradius never does.
+_CIRCLE_QUAD_SEGS = 16
+_SURELY_FITS = 1 + 1e-9
+_MAYBE_FITS = np.cos(np.pi / (4 * _CIRCLE_QUAD_SEGS)) - 1e-9
+
+# Below this many spaces a thread pool costs more than it saves.
+_PARALLEL_MIN_SPACES = 32
+
+
+def _boundary_clearance(polygon: Polygon, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+    """
+    Distance from each point (xs[i], ys[i]) to the nearest edge of polygon.
+    
+    Args:
+        polygon: Polygon whose exterior ring is measured
+        xs, ys: Point coordinates
+    
+    Returns:
+        Array of distances, one per point
+    """
+    ring = np.asarray(polygon.exterior.coords)[:, :2]
+    starts, edges = ring[:-1], np.diff(ring, axis=0)
+    edge_len2 = np.einsum("ij,ij->i", edges, edges)
+    edge_len2[edge_len2 == 0] = 1.0  # degenerate edge: distance to its start
+    
+    # (points, edges) offsets from each edge start, projected onto the edge
+    dx = xs[:, None] - starts[:, 0]
+    dy = ys[:, None] - starts[:, 1]
+    t = np.clip((dx * edges[:, 0] + dy * edges[:, 1]) / edge_len2, 0.0, 1.0)
+    dx -= t * edges[:, 0]
+    dy -= t * edges[:, 1]
+    return np.sqrt(np.min(dx * dx + dy * dy, axis=1, initial=np.inf))
+
+
 def check_turning_circle(space_dict: Dict) -> Dict:
     """
     Check if a 1500mm diameter turning circle can fit inside a space.
@@ -68,37 +108,44 @@ def check_turning_circle(space_dict: Dict) -> Dict:
     x_points = np.arange(minx + radius_mm, maxx - radius_mm + grid_spacing, grid_spacing)
     y_points = np.arange(miny + radius_mm, maxy - radius_mm + grid_spacing, grid_spacing)
     
-    # Track best attempt (closest to fitting)
+    # Candidate centers in scan order (x outer, y inner), keeping only those
+    # inside the polygon
+    xs = np.repeat(x_points, len(y_points))
+    ys = np.tile(y_points, len(x_points))
+    inside = shapely.contains_xy(polygon, xs, ys)
+    xs, ys = xs[inside], ys[inside]
+    
+    # Track how close we got (for failure reporting)
     best_center = None
     min_collision_distance = float('inf')
     
-    # Test each grid point
-    for x in x_points:
-        for y in y_points:
-            center_point = Point(x, y)
-            
-            # Skip if center is not inside polygon
-            if not polygon.contains(center_point):
-                continue
-            
-            # Create circle at this point
-            circle = center_point.buffer(radius_mm)
-            
-            # Check if circle fits entirely inside polygon
-            if polygon.contains(circle):
+    # Bounding boxes narrower than the circle leave no candidates; they skip
+    # straight to the dimensions message
+    if len(xs):
+        # The first center whose circle fits wins.  Most centers are decided
+        # by their distance to the boundary alone; only those within the
+        # buffer's polygonization error of the radius need the exact test.
+        clearance = _boundary_clearance(polygon, xs, ys)
+        for i in np.flatnonzero(clearance >= _MAYBE_FITS * radius_mm).tolist():
+            x, y = xs[i], ys[i]
+            if clearance[i] > _SURELY_FITS * radius_mm or polygon.contains(
+                Point(x, y).buffer(radius_mm, quad_segs=_CIRCLE_QUAD_SEGS)
+            ):
                 # SUCCESS - Circle fits!
                 result["passed"] = True
                 result["circle_center"] = [float(x), float(y)]
                 result["collision_details"] = f"Turning circle successfully fits with center at ({x:.1f}, {y:.1f})"
                 return result
-            
-            # Track how close we got (for failure reporting)
-            if center_point.within(polygon):
-                # Calculate how far the circle extends outside
-                collision_distance = circle.difference(polygon).area
-                if collision_distance < min_collision_distance:
-                    min_collision_distance = collision_distance
-                    best_center = (x, y)
+        
+        # Otherwise the first center whose circle extends the least outside
+        # the polygon
+        circles = shapely.buffer(
+            shapely.points(xs, ys), radius_mm, quad_segs=_CIRCLE_QUAD_SEGS
+        )
+        collision_areas = shapely.area(shapely.difference(circles, polygon))
+        best = int(np.argmin(collision_areas))
+        min_collision_distance = collision_areas[best]
+        best_center = (xs[best], ys[best])
     
     # If we reach here, no valid position was found
     if best_center:
@@ -121,21 +168,26 @@ def check_turning_circle(space_dict: Dict) -> Dict:
     return result
 
 
-def check_multiple_spaces(spaces_list: List[Dict]) -> List[Dict]:
+def check_multiple_spaces(spaces_list: List[Dict], max_workers: Optional[int] = None) -> List[Dict]:
     """
     Check turning circles for multiple spaces.
     
+    Spaces are independent and most of the work is Shapely/GEOS calls that
+    release the GIL, so larger batches are checked on a thread pool.
+    
     Args:
         spaces_list: List of space dictionaries from parser output
+        max_workers: Threads used to check spaces (None = executor default,
+                     1 = serial).  Batches of fewer than 32 spaces are
+                     always checked serially.
     
     Returns:
-        List of check results for each space
+        List of check results for each space, in input order
     """
-    results = []
-    for space in spaces_list:
-        result = check_turning_circle(space)
-        results.append(result)
-    return results
+    if len(spaces_list) >= _PARALLEL_MIN_SPACES and (max_workers is None or max_workers > 1):
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(check_turning_circle, spaces_list))
+    return [check_turning_circle(space) for space in spaces_list]
 
 
 def generate_report(results: List[Dict]) -> str:
@@ -15,17 +15,33 @@ Production-ready version with:
 - Structured logging
 """
 
+import hashlib
 import ifcopenshell
 import ifcopenshell.geom
+import ifcopenshell.util.element
 import logging
-import os
 import json
-from typing import Any, Dict, List, Optional, Tuple
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Collection, Dict, List, Optional, Tuple
+
+import numpy as np
 
 
 logger = logging.getLogger(__name__)
 
 
+def _never(_: str) -> bool:
+    return False
+
+
+def _isa(entity: Any, ifc_class: str) -> bool:
+    """entity.is_a(ifc_class), False for objects without is_a (e.g. None)."""
+    return getattr(entity, "is_a", _never)(ifc_class)
+
+
 # ---------------------------------------------------------------------------
 # Unit detection
 # ---------------------------------------------------------------------------
@@ -51,7 +67,7 @@ def detect_length_unit_scale(ifc_file: Any) -> float:
         for assignment in unit_assignments:
             units = getattr(assignment, "Units", None) or []
             for unit in units:
-                if not getattr(unit, "is_a", lambda _: False)("IfcSIUnit"):
+                if not _isa(unit, "IfcSIUnit"):
                     continue
                 unit_type = getattr(unit, "UnitType", None)
                 if unit_type != "LENGTHUNIT":
@@ -174,66 +190,239 @@ def _validate_ifc_model(ifc_file: Any) -> Tuple[bool, List[str], List[str]]:
 # Element type classification (spaces AND proxies)
 # ---------------------------------------------------------------------------
 
+# Keyword patterns per type, checked in order (first match wins).
+_TYPE_PATTERNS: Tuple[Tuple[str, "re.Pattern[str]"], ...] = tuple(
+    (space_type, re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE))
+    for space_type, keywords in (
+        ("bathroom", ("bath", "wc", "toilet", "restroom", "badrum", "toalett")),
+        ("corridor", ("corridor", "korridor", "hallway", "passage", "circulation", "gang", "gång")),
+        ("ramp", ("ramp", "rampway", "skena", "rampe")),
+        ("elevator", ("elevator", "lift", "hiss", "elevatorer")),
+        ("stair", ("stair", "stairs", "trappa", "trappor", "trappehus", "staircase")),
+        ("parking", ("parking", "parkering", "parkeringsplats", "p-plats", "parker", "garage")),
+        ("emergency_exit", ("emergency", "exit", "nödutgång", "utgång", "evacuation", "nöd")),
+    )
+)
+
+
+def _classify_text(text: str) -> str:
+    """Classify free text against _TYPE_PATTERNS; "other" if nothing matches."""
+    for space_type, pattern in _TYPE_PATTERNS:
+        if pattern.search(text):
+            return space_type
+    return "other"
+
+
+# Standardized ObjectType / PredefinedType codes, matched by equality.
+_TYPE_CODES: Dict[str, str] = {
+    "WC": "bathroom",
+    "BAD": "bathroom",
+    "TOILET": "bathroom",
+    "BATH": "bathroom",
+    "BATHROOM": "bathroom",
+    "PARKING": "parking",  # IfcSpaceTypeEnum.PARKING (IFC4)
+}
+
+
 def _classify_element_type(element: Any) -> str:
     """
     Classify any IFC element (IfcSpace or IfcBuildingElementProxy) by type.
 
-    Uses Name, Description, and LongName for keyword matching.
+    ObjectType and PredefinedType are first compared against known codes;
+    otherwise Name, Description, LongName and ObjectType are keyword-matched.
     Supports English and Swedish terminology.
 
     Returns:
         One of: "bathroom", "corridor", "ramp", "elevator", "stair",
                 "parking", "emergency_exit", "other"
     """
-    name      = (getattr(element, "Name",      "") or "").lower()
-    desc      = (getattr(element, "Description","") or "").lower()
-    longname  = (getattr(element, "LongName",  "") or "").lower()
-    text = f"{name} {desc} {longname}"
-
-    if any(kw in text for kw in ["bath", "wc", "toilet", "restroom", "badrum", "toalett"]):
-        return "bathroom"
-    if any(kw in text for kw in ["corridor", "korridor", "hallway", "passage", "circulation", "gang", "gång"]):
-        return "corridor"
-    if any(kw in text for kw in ["ramp", "rampway", "skena", "rampe"]):
-        return "ramp"
-    if any(kw in text for kw in ["elevator", "lift", "hiss", "elevatorer"]):
-        return "elevator"
-    if any(kw in text for kw in ["stair", "stairs", "trappa", "trappor", "trappehus", "staircase"]):
-        return "stair"
-    if any(kw in text for kw in ["parking", "parkering", "parkeringsplats", "p-plats", "parker", "garage"]):
-        return "parking"
-    if any(kw in text for kw in ["emergency", "exit", "nödutgång", "utgång", "evacuation", "nöd"]):
-        return "emergency_exit"
+    objtype = getattr(element, "ObjectType", None) or ""
+    for code in (objtype, getattr(element, "PredefinedType", None)):
+        if code:
+            space_type = _TYPE_CODES.get(str(code).strip().upper())
+            if space_type:
+                return space_type
 
-    return "other"
+    name      = getattr(element, "Name",       "") or ""
+    desc      = getattr(element, "Description","") or ""
+    longname  = getattr(element, "LongName",   "") or ""
+    return _classify_text(f"{name} {desc} {longname} {objtype}")
 
 
 # Thin wrapper used by _extract_space_data for IfcSpace (keeps old name working too)
 def _classify_space_type(space_name: str) -> str:
     """Classify by name string only (legacy helper, kept for compatibility)."""
-
-    class _Fake:
-        Name = space_name
-        Description = ""
-        LongName = ""
-
-    return _classify_element_type(_Fake())
+    return _classify_text(space_name or "")
 
 
 # ---------------------------------------------------------------------------
 # Main entry point
 # ---------------------------------------------------------------------------
 
-def parse_ifc(file_path: str) -> Dict[str, Any]:
+# Space types whose compliance rules read the boundary polygon (turning circle,
+# door clearance, elevator/parking/stair dimensions).
+RULE_BOUNDARY_TYPES = frozenset({"bathroom", "elevator", "parking", "stair"})
+
+# Name keywords that make the elevator/parking dimension fallbacks read the
+# boundary even for spaces classified as another type
+_ELEVATOR_NAME_KEYWORDS = ("elevator", "hiss")
+_PARKING_NAME_KEYWORDS = ("parking", "parker")
+
+
+def _is_elevator(space_type: str, space_name: str) -> bool:
+    name_lower = space_name.lower()
+    return space_type == "elevator" or any(k in name_lower for k in _ELEVATOR_NAME_KEYWORDS)
+
+
+def _is_parking(space_type: str, space_name: str) -> bool:
+    name_lower = space_name.lower()
+    return space_type == "parking" or any(k in name_lower for k in _PARKING_NAME_KEYWORDS)
+
+
+def _needs_boundary(
+    space_type: str,
+    space_name: str,
+    boundary_types: Optional[Collection[str]],
+) -> bool:
+    """Whether boundary_types asks for this space's boundary (None = all)."""
+    if boundary_types is None or space_type in boundary_types:
+        return True
+    return (
+        ("elevator" in boundary_types and _is_elevator(space_type, space_name))
+        or ("parking" in boundary_types and _is_parking(space_type, space_name))
+    )
+
+# Opt-in on-disk parse cache shared between processes (e.g. separate test
+# drivers in one CI run).  Entries are keyed by a hash of the file contents;
+# bump the version whenever the parser's output format changes.
+_DISK_CACHE_DIR = os.environ.get("NODAL_PARSE_CACHE_DIR")
+_DISK_CACHE_VERSION = 1
+
+# In-process memo of recent successful parses, most recently used last.
+_MEMO_SIZE = 8
+_memo: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
+_memo_lock = threading.Lock()
+
+
+def parse_ifc(
+    file_path: str,
+    boundary_types: Optional[Collection[str]] = None,
+    cache_dir: Optional[str] = None,
+    memoize: bool = True,
+) -> Dict[str, Any]:
     """
     Parse IFC file and extract all space entities with bathroom identification.
 
+    Successful parses are memoized per (path, modification time, size,
+    boundary_types) for the last 8 files, so re-parsing an unchanged file is
+    free.  A memoized result is shared between callers and must not be
+    modified.  With a cache directory, successful parses are also stored
+    there as JSON, keyed by the file's contents, and reused by later
+    processes.
+
     Args:
-        file_path: Path to the IFC file
+        file_path:   Path to the IFC file
+        boundary_types: Only extract boundary polygons for these space types
+                     (e.g. RULE_BOUNDARY_TYPES), plus spaces whose name
+                     triggers the elevator/parking dimension fallbacks;
+                     None extracts all.
+        cache_dir:   Directory for the on-disk parse cache (default: the
+                     NODAL_PARSE_CACHE_DIR environment variable; unset
+                     disables it)
+        memoize:     Keep the result in the in-process memo; pass False for
+                     files that are parsed once (e.g. uploaded temp files)
 
     Returns:
         Dictionary containing spaces list and summary statistics
     """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return _parse_ifc(file_path, boundary_types)
+
+    key = (
+        os.path.abspath(file_path),
+        stat.st_mtime_ns,
+        stat.st_size,
+        None if boundary_types is None else frozenset(boundary_types),
+    )
+    with _memo_lock:
+        result = _memo.get(key)
+        if result is not None:
+            _memo.move_to_end(key)
+            return result
+
+    cache_dir = cache_dir or _DISK_CACHE_DIR
+    if cache_dir:
+        result = _parse_ifc_disk_cached(file_path, boundary_types, cache_dir)
+    else:
+        result = _parse_ifc(file_path, boundary_types)
+
+    if memoize and not result["summary"]["errors"]:
+        with _memo_lock:
+            _memo[key] = result
+            if len(_memo) > _MEMO_SIZE:
+                _memo.popitem(last=False)
+    return result
+
+
+def _parse_ifc_disk_cached(
+    file_path: str,
+    boundary_types: Optional[Collection[str]],
+    cache_dir: str,
+) -> Dict[str, Any]:
+    """On-disk layer for parse_ifc, keyed by file contents and boundary_types."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((
+        _DISK_CACHE_VERSION,
+        None if boundary_types is None else sorted(boundary_types),
+    )).encode())
+    try:
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+    except OSError:
+        return _parse_ifc(file_path, boundary_types)
+
+    # Entries are plain JSON so a shared cache directory can't inject code
+    cache_path = os.path.join(cache_dir, f"{digest.hexdigest()}.json")
+    try:
+        with open(cache_path, "rb") as f:
+            cached = json.load(f)
+        if isinstance(cached, dict) and "spaces" in cached and "summary" in cached:
+            return cached
+        logger.warning(f"Ignoring malformed parse cache entry {cache_path}")
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable parse cache entry {cache_path}: {e}")
+
+    result = _parse_ifc(file_path, boundary_types)
+    if result["summary"]["errors"]:
+        return result
+
+    # Write to a temporary file first so concurrent readers never see a
+    # partial entry
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning(f"Could not write parse cache entry {cache_path}: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+    return result
+
+
+def _parse_ifc(
+    file_path: str,
+    boundary_types: Optional[Collection[str]] = None,
+) -> Dict[str, Any]:
+    """Uncached implementation of parse_ifc."""
     logger.info(f"Parsing IFC file: {file_path}")
 
     # Validate file existence
@@ -385,20 +574,46 @@ def parse_ifc(file_path: str) -> Dict[str, Any]:
     }
     proxies_reclassified = 0
     runtime_errors: List[str] = []
+    storey_cache: Dict[int, Optional[int]] = {}
+    geom_settings = _geometry_settings()
+
+    # Classify every element once, then extract the boundaries that are
+    # needed in bulk (see _extract_boundaries)
+    space_types = [_classify_element_type(space) for space in spaces]
+    proxy_types = [(proxy, _classify_element_type(proxy)) for proxy in proxies]
+    typed_elements = list(zip(spaces, space_types)) + [
+        (proxy, proxy_type) for proxy, proxy_type in proxy_types if proxy_type != "other"
+    ]
+    boundaries = _extract_boundaries(
+        ifc_file,
+        [
+            element for element, element_type in typed_elements
+            if _needs_boundary(
+                element_type, getattr(element, "Name", None) or "Unknown", boundary_types
+            )
+        ],
+        unit_scale,
+        geom_settings,
+    )
+
+    def _extract(element: Any, element_type: str) -> Optional[Dict[str, Any]]:
+        return _extract_space_data(
+            element, ifc_file, unit_scale, storey_cache, geom_settings,
+            boundary_types, boundaries, element_type,
+        )
 
     # Process IfcSpace objects
-    for space in spaces:
-        space_data = _extract_space_data(space, ifc_file, unit_scale)
+    for space, space_type in zip(spaces, space_types):
+        space_data = _extract(space, space_type)
         if space_data:
             parsed_spaces.append(space_data)
             t = space_data.get("type", "other")
             type_counts[t] = type_counts.get(t, 0) + 1
 
     # Process IfcBuildingElementProxy objects
-    for proxy in proxies:
-        proxy_type = _classify_element_type(proxy)
+    for proxy, proxy_type in proxy_types:
         if proxy_type != "other":
-            proxy_data = _extract_space_data(proxy, ifc_file, unit_scale)
+            proxy_data = _extract(proxy, proxy_type)
             if proxy_data:
                 proxy_data["type"] = proxy_type  # override with proxy classification
                 proxy_data["source"] = "IfcBuildingElementProxy"
@@ -448,51 +663,78 @@ def parse_ifc(file_path: str) -> Dict[str, Any]:
 # Internal helpers
 # ---------------------------------------------------------------------------
 
-def _get_property_value(space: Any, *property_names: str) -> Optional[Any]:
+# Property names probed per rule.  Aliases are not ranked: whichever comes
+# first in property-set order wins (see _pick_value).
+_CORRIDOR_WIDTH_PROPS = ("Width", "ClearWidth")
+_RAMP_SLOPE_PROPS = ("Slope", "Gradient")
+_HANDRAIL_HEIGHT_PROPS = ("HandrailHeight",)
+_ELEVATOR_WIDTH_PROPS = ("Width", "CabWidth")
+_ELEVATOR_DEPTH_PROPS = ("Depth", "CabDepth", "Length")
+_EXIT_WIDTH_PROPS = ("ExitWidth", "Width", "ClearWidth")
+_STAIR_RISE_PROPS = ("RiserHeight", "Rise", "StepRise")
+_STAIR_RUN_PROPS = ("TreadDepth", "Run", "Tread", "StepRun")
+_PARKING_WIDTH_PROPS = ("Width", "ParkingWidth", "ClearWidth")
+_PARKING_LENGTH_PROPS = ("Length", "ParkingLength", "Depth")
+_HANDRAIL_BOTH_PROPS = ("HandrailBothSides", "HandrailsBothSides")
+_STAIR_WIDTH_PROPS = ("StairWidth", "Width", "ClearWidth")
+_SILL_HEIGHT_PROPS = ("SillHeight", "WindowSillHeight", "SillHeightAboveFloor")
+_OPENING_WIDTH_PROPS = ("OpeningWidth", "Width", "WindowWidth")
+_OPENING_HEIGHT_PROPS = ("OpeningHeight", "Height", "WindowHeight")
+_TACTILE_PROPS = ("TactileGuidance", "TactileFloorGuidance", "TactileGuidancePresent")
+_DOOR_SWING_PROPS = ("SwingDirection", "OperationType")
+_DOOR_WIDTH_PROPS = ("Width", "ClearWidth", "OverallWidth")
+
+
+def _collect_properties(entity: Any) -> Dict[str, Any]:
     """
-    Get first matching IfcPropertySingleValue from space's property sets.
-
-    Searches IsDefinedBy -> IfcRelDefinesByProperties -> IfcPropertySet -> HasProperties.
-    Fully exception-safe — always returns None rather than raising.
+    Collect the single property values of an entity into one flat map.
+
+    Uses ifcopenshell.util.element.get_psets on the entity's own property
+    sets (no quantity sets, nothing inherited from the element type) and
+    returns {property name: value} in property-set order.  Only single
+    values are kept: enumerated, list, bounded, table and complex
+    properties come back as lists or dicts and are skipped, as the
+    IfcPropertySingleValue walk this replaces did.  The first occurrence of
+    a name wins; the "id" bookkeeping key of each set is skipped.  Fully
+    exception-safe — returns an empty map on failure.
     """
+    props: Dict[str, Any] = {}
     try:
-        for rel in getattr(space, "IsDefinedBy", []) or []:
-            try:
-                if not getattr(rel, "is_a", lambda _: False)("IfcRelDefinesByProperties"):
-                    continue
-                pset = getattr(rel, "RelatingPropertyDefinition", None)
-                if pset is None:
-                    continue
-                if not getattr(pset, "is_a", lambda _: False)("IfcPropertySet"):
-                    continue
-                for prop in getattr(pset, "HasProperties", []) or []:
-                    try:
-                        if not getattr(prop, "is_a", lambda _: False)("IfcPropertySingleValue"):
-                            continue
-                        if getattr(prop, "Name", None) in property_names:
-                            nv = getattr(prop, "NominalValue", None)
-                            if nv is None:
-                                return None
-                            return getattr(nv, "wrappedValue", nv)
-                    except Exception:
-                        continue
-            except Exception:
-                continue
+        psets = ifcopenshell.util.element.get_psets(
+            entity, psets_only=True, should_inherit=False
+        )
     except Exception as e:
-        logger.debug(f"Property extraction failed for {property_names}: {e}")
+        logger.debug(f"Property collection failed: {e}")
+        return props
+
+    for pset in psets.values():
+        for name, value in pset.items():
+            if name == "id" or name in props or isinstance(value, (list, tuple, dict)):
+                continue
+            props[name] = value
+    return props
 
+
+def _pick_value(props: Dict[str, Any], property_names: Tuple[str, ...]) -> Optional[Any]:
+    """
+    Return the value of the first property in props (property-set order)
+    whose name is one of property_names.
+    """
+    for name, value in props.items():
+        if name in property_names:
+            return value
     return None
 
 
-def _get_property_as_mm(
-    space: Any, *property_names: str, unit_scale: float = 1000.0
+def _pick_mm(
+    props: Dict[str, Any], property_names: Tuple[str, ...], unit_scale: float = 1000.0
 ) -> Optional[float]:
     """
-    Get numeric property and convert to millimeters using unit_scale.
+    Pick numeric property and convert to millimeters using unit_scale.
     Returns None for missing, negative, or non-numeric values.
     """
     try:
-        val = _get_property_value(space, *property_names)
+        val = _pick_value(props, property_names)
         if val is None:
             return None
         n = float(val)
@@ -502,14 +744,14 @@ def _get_property_as_mm(
     except (TypeError, ValueError):
         return None
     except Exception as e:
-        logger.debug(f"_get_property_as_mm failed for {property_names}: {e}")
+        logger.debug(f"_pick_mm failed for {property_names}: {e}")
         return None
 
 
-def _get_property_bool(space: Any, *property_names: str) -> Optional[bool]:
-    """Get boolean property from space."""
+def _pick_bool(props: Dict[str, Any], property_names: Tuple[str, ...]) -> Optional[bool]:
+    """Pick boolean property."""
     try:
-        val = _get_property_value(space, *property_names)
+        val = _pick_value(props, property_names)
         if val is None:
             return None
         if isinstance(val, bool):
@@ -521,6 +763,31 @@ def _get_property_bool(space: Any, *property_names: str) -> Optional[bool]:
         return None
 
 
+def _get_property_value(space: Any, *property_names: str) -> Optional[Any]:
+    """
+    Get first matching IfcPropertySingleValue from space's property sets.
+
+    Prefer _collect_properties + _pick_* when probing the same entity more
+    than once.
+    """
+    return _pick_value(_collect_properties(space), property_names)
+
+
+def _get_property_as_mm(
+    space: Any, *property_names: str, unit_scale: float = 1000.0
+) -> Optional[float]:
+    """
+    Get numeric property and convert to millimeters using unit_scale.
+    Returns None for missing, negative, or non-numeric values.
+    """
+    return _pick_mm(_collect_properties(space), property_names, unit_scale)
+
+
+def _get_property_bool(space: Any, *property_names: str) -> Optional[bool]:
+    """Get boolean property from space."""
+    return _pick_bool(_collect_properties(space), property_names)
+
+
 def _get_dimensions_from_boundary(
     boundary: List[List[float]],
 ) -> Dict[str, float]:
@@ -551,17 +818,16 @@ def _get_door_swing_and_width(
     try:
         for rel in getattr(space, "BoundedBy", []) or []:
             try:
-                if not getattr(rel, "is_a", lambda _: False)("IfcRelSpaceBoundary"):
+                if not _isa(rel, "IfcRelSpaceBoundary"):
                     continue
                 elem = getattr(rel, "RelatedBuildingElement", None)
-                if elem is not None and getattr(elem, "is_a", lambda _: False)("IfcDoor"):
-                    swing = _get_property_value(elem, "SwingDirection", "OperationType")
+                if elem is not None and _isa(elem, "IfcDoor"):
+                    door_props = _collect_properties(elem)
+                    swing = _pick_value(door_props, _DOOR_SWING_PROPS)
                     if swing is not None:
                         s = str(swing).upper()
                         opens_outward = "OUTWARD" in s or "OUT" in s
-                    w = _get_property_as_mm(
-                        elem, "Width", "ClearWidth", "OverallWidth", unit_scale=unit_scale
-                    )
+                    w = _pick_mm(door_props, _DOOR_WIDTH_PROPS, unit_scale)
                     if w is not None:
                         width_mm = w
                     if opens_outward is not None and width_mm is not None:
@@ -574,16 +840,25 @@ def _get_door_swing_and_width(
 
 
 def _extract_boundary_safe(
-    space: Any, ifc_file: Any, unit_scale: float = 1000.0
+    space: Any,
+    ifc_file: Any,
+    unit_scale: float = 1000.0,
+    geom_settings: Optional[Any] = None,
+    boundaries: Optional[Dict[int, Optional[List[List[float]]]]] = None,
 ) -> Optional[List[List[float]]]:
     """
     Extract boundary with full validation.
 
     Returns list of [x, y] coords in mm, or None if invalid/missing.
     Replaces direct calls to _extract_boundary in production paths.
+    Boundaries already extracted in bulk (see _extract_boundaries) are
+    taken from boundaries by entity id.
     """
     try:
-        boundary = _extract_boundary(space, ifc_file, unit_scale)
+        if boundaries is not None and space.id() in boundaries:
+            boundary = boundaries[space.id()]
+        else:
+            boundary = _extract_boundary(space, ifc_file, unit_scale, geom_settings)
 
         if not boundary or len(boundary) < 3:
             return None
@@ -612,32 +887,39 @@ def _extract_boundary_safe(
 
 
 def _extract_space_data(
-    space: Any, ifc_file: Any, unit_scale: float = 1000.0
+    space: Any,
+    ifc_file: Any,
+    unit_scale: float = 1000.0,
+    storey_cache: Optional[Dict[int, Optional[int]]] = None,
+    geom_settings: Optional[Any] = None,
+    boundary_types: Optional[Collection[str]] = None,
+    boundaries: Optional[Dict[int, Optional[List[List[float]]]]] = None,
+    space_type: Optional[str] = None,
 ) -> Optional[Dict[str, Any]]:
     """
     Extract data from a single IfcSpace (or compatible proxy) entity.
 
     Args:
-        space:      IfcSpace or IfcBuildingElementProxy entity
-        ifc_file:   Opened IFC file object
-        unit_scale: Multiplier to convert native IFC lengths → mm
+        space:        IfcSpace or IfcBuildingElementProxy entity
+        ifc_file:     Opened IFC file object
+        unit_scale:   Multiplier to convert native IFC lengths → mm
+        storey_cache: Shared storey.id() -> floor level memo (see _get_floor_level)
+        geom_settings: Shared geometry settings (see _geometry_settings)
+        boundary_types: Space types to extract a boundary for (None = all)
+        boundaries:   Pre-extracted boundaries by entity id (see _extract_boundaries)
+        space_type:   The element's _classify_element_type, if already known
 
     Returns:
         Dictionary with space data or None if extraction fails
     """
     try:
-        space_id = (
-            space.GlobalId if hasattr(space, "GlobalId") else str(space.id())
-        )
-        space_name = (
-            space.Name
-            if hasattr(space, "Name") and space.Name
-            else "Unknown"
-        )
+        space_id = getattr(space, "GlobalId", None) or str(space.id())
+        space_name = getattr(space, "Name", None) or "Unknown"
 
         # Use full element classifier (checks Name + Description + LongName)
-        space_type = _classify_element_type(space)
-        floor_level = _get_floor_level(space, ifc_file, unit_scale)
+        if space_type is None:
+            space_type = _classify_element_type(space)
+        floor_level = _get_floor_level(space, ifc_file, unit_scale, storey_cache)
 
         space_data: Dict[str, Any] = {
             "id": space_id,
@@ -647,19 +929,27 @@ def _extract_space_data(
         }
 
         # Use safe boundary extraction with validation
-        boundary = _extract_boundary_safe(space, ifc_file, unit_scale)
+        boundary = None
+        if _needs_boundary(space_type, space_name, boundary_types):
+            boundary = _extract_boundary_safe(
+                space, ifc_file, unit_scale, geom_settings, boundaries
+            )
         if boundary:
             space_data["boundary"] = boundary
 
         # --- Rule-related properties (all lengths converted to mm via unit_scale) ---
+        # All property sets are walked once; each rule then probes the map.
+        # Likewise the bounding doors, which three rules read.
+        props = _collect_properties(space)
+        door_swing, door_w = _get_door_swing_and_width(space, ifc_file, unit_scale)
 
         # Corridor width (3:22)
-        v = _get_property_as_mm(space, "Width", "ClearWidth", unit_scale=unit_scale)
+        v = _pick_mm(props, _CORRIDOR_WIDTH_PROPS, unit_scale)
         if v is not None:
             space_data["corridor_width_mm"] = v
 
         # Ramp slope (3:231) — dimensionless ratio, no unit conversion
-        slope_val = _get_property_value(space, "Slope", "Gradient")
+        slope_val = _pick_value(props, _RAMP_SLOPE_PROPS)
         if slope_val is not None:
             try:
                 r = float(slope_val)
@@ -671,25 +961,21 @@ def _extract_space_data(
                 pass
 
         # Handrail height (3:232)
-        v = _get_property_as_mm(space, "HandrailHeight", unit_scale=unit_scale)
+        v = _pick_mm(props, _HANDRAIL_HEIGHT_PROPS, unit_scale)
         if v is not None:
             space_data["handrail_height_mm"] = v
 
         # Bathroom door opens outward (3:241)
-        door_swing, _ = _get_door_swing_and_width(space, ifc_file, unit_scale)
         if door_swing is not None:
             space_data["door_opens_outward"] = door_swing
 
         # Elevator dimensions (3:143, 3:144)
-        ew = _get_property_as_mm(space, "Width", "CabWidth", unit_scale=unit_scale)
-        ed = _get_property_as_mm(space, "Depth", "CabDepth", "Length", unit_scale=unit_scale)
+        is_elevator = _is_elevator(space_type, space_name)
+        ew = _pick_mm(props, _ELEVATOR_WIDTH_PROPS, unit_scale)
+        ed = _pick_mm(props, _ELEVATOR_DEPTH_PROPS, unit_scale)
         if boundary and (ew is None or ed is None):
             dims = _get_dimensions_from_boundary(boundary)
-            if (
-                space_type == "elevator"
-                or "elevator" in space_name.lower()
-                or "hiss" in space_name.lower()
-            ):
+            if is_elevator:
                 if ew is None and dims.get("width_mm") is not None:
                     ew = dims["width_mm"]
                 if ed is None and dims.get("depth_mm") is not None:
@@ -700,53 +986,34 @@ def _extract_space_data(
             space_data["elevator_depth_mm"] = ed
 
         # Elevator door width (3:144)
-        _, door_w = _get_door_swing_and_width(space, ifc_file, unit_scale)
-        if door_w is not None and (
-            space_type == "elevator"
-            or "elevator" in space_name.lower()
-            or "hiss" in space_name.lower()
-        ):
+        if door_w is not None and is_elevator:
             space_data["elevator_door_width_mm"] = door_w
 
         # Emergency exit width (3:51)
-        v = _get_property_as_mm(
-            space, "ExitWidth", "Width", "ClearWidth", unit_scale=unit_scale
-        )
+        v = _pick_mm(props, _EXIT_WIDTH_PROPS, unit_scale)
         if v is not None:
             space_data["emergency_exit_width_mm"] = v
 
         # Emergency exit door opens outward (3:52)
-        if space_type == "emergency_exit" or "exit" in space_name.lower() or "nöd" in space_name.lower():
-            door_swing_ex, _ = _get_door_swing_and_width(space, ifc_file, unit_scale)
-            if door_swing_ex is not None:
-                space_data["emergency_exit_door_opens_outward"] = door_swing_ex
+        name_lower = space_name.lower()
+        if space_type == "emergency_exit" or "exit" in name_lower or "nöd" in name_lower:
+            if door_swing is not None:
+                space_data["emergency_exit_door_opens_outward"] = door_swing
 
         # Stair rise and run (3:421)
-        rise = _get_property_as_mm(
-            space, "RiserHeight", "Rise", "StepRise", unit_scale=unit_scale
-        )
+        rise = _pick_mm(props, _STAIR_RISE_PROPS, unit_scale)
         if rise is not None:
             space_data["stair_rise_mm"] = rise
-        run = _get_property_as_mm(
-            space, "TreadDepth", "Run", "Tread", "StepRun", unit_scale=unit_scale
-        )
+        run = _pick_mm(props, _STAIR_RUN_PROPS, unit_scale)
         if run is not None:
             space_data["stair_run_mm"] = run
 
         # Parking dimensions (3:131, 3:132)
-        pw = _get_property_as_mm(
-            space, "Width", "ParkingWidth", "ClearWidth", unit_scale=unit_scale
-        )
-        pl = _get_property_as_mm(
-            space, "Length", "ParkingLength", "Depth", unit_scale=unit_scale
-        )
+        pw = _pick_mm(props, _PARKING_WIDTH_PROPS, unit_scale)
+        pl = _pick_mm(props, _PARKING_LENGTH_PROPS, unit_scale)
         if boundary and (pw is None or pl is None):
             dims = _get_dimensions_from_boundary(boundary)
-            if (
-                space_type == "parking"
-                or "parking" in space_name.lower()
-                or "parker" in space_name.lower()
-            ):
+            if _is_parking(space_type, space_name):
                 if pw is None and dims.get("width_mm") is not None:
                     pw = dims["width_mm"]
                 if pl is None and dims.get("length_mm") is not None:
@@ -757,14 +1024,12 @@ def _extract_space_data(
             space_data["parking_length_mm"] = pl
 
         # Stair handrail both sides (3:411)
-        both = _get_property_bool(space, "HandrailBothSides", "HandrailsBothSides")
+        both = _pick_bool(props, _HANDRAIL_BOTH_PROPS)
         if both is not None:
             space_data["stair_handrail_both_sides"] = both
 
         # Stair width (3:412)
-        v = _get_property_as_mm(
-            space, "StairWidth", "Width", "ClearWidth", unit_scale=unit_scale
-        )
+        v = _pick_mm(props, _STAIR_WIDTH_PROPS, unit_scale)
         if v is not None:
             space_data["stair_width_mm"] = v
         elif boundary and space_type == "stair":
@@ -773,29 +1038,20 @@ def _extract_space_data(
                 space_data["stair_width_mm"] = dims["width_mm"]
 
         # Window sill height (3:531)
-        v = _get_property_as_mm(
-            space, "SillHeight", "WindowSillHeight", "SillHeightAboveFloor",
-            unit_scale=unit_scale,
-        )
+        v = _pick_mm(props, _SILL_HEIGHT_PROPS, unit_scale)
         if v is not None:
             space_data["window_sill_height_mm"] = v
 
         # Window opening size (3:532)
-        wo_w = _get_property_as_mm(
-            space, "OpeningWidth", "Width", "WindowWidth", unit_scale=unit_scale
-        )
-        wo_h = _get_property_as_mm(
-            space, "OpeningHeight", "Height", "WindowHeight", unit_scale=unit_scale
-        )
+        wo_w = _pick_mm(props, _OPENING_WIDTH_PROPS, unit_scale)
+        wo_h = _pick_mm(props, _OPENING_HEIGHT_PROPS, unit_scale)
         if wo_w is not None:
             space_data["window_opening_width_mm"] = wo_w
         if wo_h is not None:
             space_data["window_opening_height_mm"] = wo_h
 
         # Tactile guidance (3:611)
-        tg = _get_property_bool(
-            space, "TactileGuidance", "TactileFloorGuidance", "TactileGuidancePresent"
-        )
+        tg = _pick_bool(props, _TACTILE_PROPS)
         if tg is not None:
             space_data["tactile_guidance_present"] = tg
 
@@ -807,49 +1063,63 @@ def _extract_space_data(
         return None
 
 
+_STOREY_NUM_RE = re.compile(r"\d+")
+
+
+def _storey_level(storey: Any, unit_scale: float = 1000.0) -> Optional[int]:
+    """Floor level of an IfcBuildingStorey from its Elevation, else its Name."""
+    elevation = getattr(storey, "Elevation", None)
+    if elevation is not None:
+        return int(round(elevation / (3000.0 / unit_scale))) + 1
+    storey_name = getattr(storey, "Name", None)
+    if storey_name:
+        match = _STOREY_NUM_RE.search(storey_name)
+        if match:
+            return int(match.group())
+    return None
+
+
 def _get_floor_level(
-    space: Any, ifc_file: Any, unit_scale: float = 1000.0
+    space: Any,
+    ifc_file: Any,
+    unit_scale: float = 1000.0,
+    storey_cache: Optional[Dict[int, Optional[int]]] = None,
 ) -> int:
     """
     Extract floor level from space's building storey.
+
+    storey_cache maps storey.id() -> level; pass the same dict for all spaces
+    of one file so each storey is resolved only once.
     """
-    three_metres_native = 3000.0 / unit_scale
+    if storey_cache is None:
+        storey_cache = {}
 
-    try:
-        import re
-
-        def _storey_level(storey: Any) -> Optional[int]:
-            if hasattr(storey, "Elevation") and storey.Elevation is not None:
-                return int(round(storey.Elevation / three_metres_native)) + 1
-            if hasattr(storey, "Name") and storey.Name:
-                match = re.search(r"\d+", storey.Name)
-                if match:
-                    return int(match.group())
-            return None
+    def _level(storey: Any) -> Optional[int]:
+        key = storey.id()
+        if key not in storey_cache:
+            storey_cache[key] = _storey_level(storey, unit_scale)
+        return storey_cache[key]
 
-        if hasattr(space, "Decomposes") and space.Decomposes:
-            for rel in space.Decomposes:
-                try:
-                    if hasattr(rel, "RelatingObject"):
-                        storey = rel.RelatingObject
-                        if storey.is_a("IfcBuildingStorey"):
-                            lvl = _storey_level(storey)
-                            if lvl is not None:
-                                return lvl
-                except Exception:
-                    continue
+    try:
+        for rel in getattr(space, "Decomposes", None) or ():
+            try:
+                storey = getattr(rel, "RelatingObject", None)
+                if _isa(storey, "IfcBuildingStorey"):
+                    lvl = _level(storey)
+                    if lvl is not None:
+                        return lvl
+            except Exception:
+                continue
 
-        if hasattr(space, "ContainedInStructure") and space.ContainedInStructure:
-            for rel in space.ContainedInStructure:
-                try:
-                    if hasattr(rel, "RelatingStructure"):
-                        storey = rel.RelatingStructure
-                        if storey.is_a("IfcBuildingStorey"):
-                            lvl = _storey_level(storey)
-                            if lvl is not None:
-                                return lvl
-                except Exception:
-                    continue
+        for rel in getattr(space, "ContainedInStructure", None) or ():
+            try:
+                storey = getattr(rel, "RelatingStructure", None)
+                if _isa(storey, "IfcBuildingStorey"):
+                    lvl = _level(storey)
+                    if lvl is not None:
+                        return lvl
+            except Exception:
+                continue
 
     except Exception:
         pass
@@ -857,57 +1127,129 @@ def _get_floor_level(
     return 0
 
 
+def _geometry_settings() -> Any:
+    """Geometry-kernel settings used for boundary fallback (world coordinates)."""
+    settings = ifcopenshell.geom.settings()
+    settings.set(settings.USE_WORLD_COORDS, True)
+    return settings
+
+
+def _tessellate(
+    ifc_file: Any, geom_settings: Any, elements: List[Any]
+) -> Optional[Dict[int, Any]]:
+    """
+    Tessellate elements with the multi-threaded geometry iterator.
+
+    Returns {entity id: flat vertex buffer (metres)}; elements without
+    geometry are absent.  Returns None if the iterator cannot run, in which
+    case callers fall back to create_shape per element.
+    """
+    verts: Dict[int, Any] = {}
+    if not elements:
+        return verts
+    try:
+        iterator = ifcopenshell.geom.iterator(
+            geom_settings, ifc_file, os.cpu_count() or 1, include=elements
+        )
+        if iterator.initialize():
+            while True:
+                shape = iterator.get()
+                verts[shape.id] = shape.geometry.verts
+                if not iterator.next():
+                    break
+    except Exception as e:
+        logger.warning(f"Batch tessellation failed, falling back per space: {e}")
+        return None
+    return verts
+
+
+def _extract_boundaries(
+    ifc_file: Any,
+    elements: List[Any],
+    unit_scale: float = 1000.0,
+    geom_settings: Optional[Any] = None,
+) -> Dict[int, Optional[List[List[float]]]]:
+    """
+    Extract the boundaries of many elements, by entity id (unvalidated, mm).
+
+    Space boundary relationships are read first; only elements without a
+    usable one are tessellated, in one multi-threaded geometry-iterator run
+    instead of one create_shape call per element.
+    """
+    boundaries: Dict[int, Optional[List[List[float]]]] = {}
+    fallback = []
+    for element in elements:
+        boundary = _boundary_from_relations(element, unit_scale)
+        if boundary is None and getattr(element, "Representation", None) is not None:
+            fallback.append(element)
+        boundaries[element.id()] = boundary
+
+    if geom_settings is None:
+        geom_settings = _geometry_settings()
+    shape_verts = _tessellate(ifc_file, geom_settings, fallback)
+    for element in fallback:
+        boundaries[element.id()] = _boundary_from_geometry(
+            element, geom_settings, shape_verts
+        )
+    return boundaries
+
+
 def _extract_boundary(
-    space: Any, ifc_file: Any, unit_scale: float = 1000.0
+    space: Any,
+    ifc_file: Any,
+    unit_scale: float = 1000.0,
+    geom_settings: Optional[Any] = None,
 ) -> Optional[List[List[float]]]:
     """
     Extract boundary polygon coordinates from space and return them in mm.
+
+    Space boundary relationships are used when they give an outline;
+    otherwise the space is tessellated with geom_settings (created when
+    omitted).
     """
-    try:
-        # Primary: space boundary relationships
-        if hasattr(space, "BoundedBy") and space.BoundedBy:
-            boundary_points: List[List[float]] = []
-
-            for boundary_rel in space.BoundedBy:
-                try:
-                    if hasattr(boundary_rel, "RelatedBuildingElement"):
-                        boundary = boundary_rel.RelatedBuildingElement
-                        if hasattr(boundary, "ConnectionGeometry"):
-                            conn_geom = boundary.ConnectionGeometry
-                            if hasattr(conn_geom, "SurfaceOnRelatingElement"):
-                                surface = conn_geom.SurfaceOnRelatingElement
-                                points = _extract_points_from_surface(surface)
-                                if points:
-                                    boundary_points.extend(points)
-                except Exception:
-                    continue
+    bounded_by = getattr(space, "BoundedBy", None)
+    if getattr(space, "Representation", None) is None and not bounded_by:
+        return None  # logical-only space, nothing to tessellate
 
-            if boundary_points:
-                unique_points = _remove_duplicate_points(boundary_points)
-                if len(unique_points) >= 3:
-                    return convert_to_millimeters(unique_points, unit_scale)
+    boundary = _boundary_from_relations(space, unit_scale)
+    if boundary is None:
+        boundary = _boundary_from_geometry(space, geom_settings)
+    return boundary
 
-        # Fallback: geometry kernel
-        settings = ifcopenshell.geom.settings()
-        settings.set(settings.USE_WORLD_COORDS, True)
 
-        try:
-            shape = ifcopenshell.geom.create_shape(settings, space)
-            if shape:
-                verts = shape.geometry.verts
-                points = []
-                for i in range(0, len(verts), 3):
-                    x, y = verts[i], verts[i + 1]
-                    points.append([round(x, 3), round(y, 3)])
-
-                if points:
-                    unique_points = _remove_duplicate_points(points)
-                    if len(unique_points) >= 3:
-                        # Geometry kernel always outputs metres → always ×1000
-                        return convert_to_millimeters(unique_points[:50], unit_scale=1000.0)
-        except Exception:
-            pass
+def _boundary_from_relations(
+    space: Any, unit_scale: float = 1000.0
+) -> Optional[List[List[float]]]:
+    """
+    Boundary in mm from the space's IfcRelSpaceBoundary surfaces, or None if
+    they give fewer than 3 unique points.
+    """
+    try:
+        bounded_by = getattr(space, "BoundedBy", None)
+        if not bounded_by:
+            return None
+
+        # Deduplicate while accumulating (same 0.01 grid as
+        # _remove_duplicate_points)
+        seen: set = set()
+        unique_points: List[List[float]] = []
+
+        for boundary_rel in bounded_by:
+            try:
+                boundary = getattr(boundary_rel, "RelatedBuildingElement", None)
+                conn_geom = getattr(boundary, "ConnectionGeometry", None)
+                surface = getattr(conn_geom, "SurfaceOnRelatingElement", None)
+                if surface is not None:
+                    for x, y in _extract_points_from_surface(surface):
+                        key = (round(x / 0.01), round(y / 0.01))
+                        if key not in seen:
+                            seen.add(key)
+                            unique_points.append([x, y])
+            except Exception:
+                continue
 
+        if len(unique_points) >= 3:
+            return convert_to_millimeters(unique_points, unit_scale)
         return None
 
     except Exception as e:
@@ -916,48 +1258,84 @@ def _extract_boundary(
         return None
 
 
+def _boundary_from_geometry(
+    space: Any,
+    geom_settings: Optional[Any] = None,
+    shape_verts: Optional[Dict[int, Any]] = None,
+) -> Optional[List[List[float]]]:
+    """
+    Boundary in mm from the space's tessellated geometry, or None.
+
+    Vertices are read from shape_verts when given (see _tessellate),
+    otherwise the space is tessellated with geom_settings.
+    """
+    try:
+        if shape_verts is not None:
+            verts = shape_verts.get(space.id())
+        else:
+            if geom_settings is None:
+                geom_settings = _geometry_settings()
+            shape = ifcopenshell.geom.create_shape(geom_settings, space)
+            verts = shape.geometry.verts if shape else None
+        if verts is not None:
+            verts = np.asarray(verts, dtype=np.float64)
+            points = np.round(verts.reshape(-1, 3)[:, :2], 3)
+
+            if len(points):
+                unique_points = _remove_duplicate_points(points)
+                if len(unique_points) >= 3:
+                    # Geometry kernel always outputs metres → always ×1000
+                    return convert_to_millimeters(unique_points[:50], unit_scale=1000.0)
+    except Exception:
+        pass
+
+    return None
+
+
 def _extract_points_from_surface(surface: Any) -> List[List[float]]:
     """
     Extract coordinate points from an IFC surface geometry.
     Returns points in native IFC units (caller applies unit_scale).
     """
-    points: List[List[float]] = []
+    raw: List[Tuple[float, float]] = []
     try:
-        if hasattr(surface, "OuterBoundary"):
-            curve = surface.OuterBoundary
-            if hasattr(curve, "Points"):
-                for point in curve.Points:
-                    try:
-                        if hasattr(point, "Coordinates"):
-                            coords = point.Coordinates
-                            if len(coords) >= 2:
-                                points.append([round(coords[0], 3), round(coords[1], 3)])
-                    except Exception:
-                        continue
+        curve = getattr(surface, "OuterBoundary", None)
+        for point in getattr(curve, "Points", None) or ():
+            try:
+                coords = getattr(point, "Coordinates", None)
+                if coords is not None and len(coords) >= 2:
+                    raw.append((coords[0], coords[1]))
+            except Exception:
+                continue
     except Exception:
         pass
-    return points
+    if not raw:
+        return []
+    return np.round(np.asarray(raw, dtype=np.float64), 3).tolist()
 
 
 def _remove_duplicate_points(
     points: List[List[float]], tolerance: float = 0.01
 ) -> List[List[float]]:
-    """Remove duplicate points from a list of [x, y] coordinate pairs."""
-    if not points:
+    """
+    Remove duplicate points from a list of [x, y] coordinate pairs.
+
+    Points are snapped to a grid of cell size `tolerance`; the first point in
+    each cell is kept and input order is preserved.
+    """
+    if len(points) == 0:
         return []
-    unique = [points[0]]
-    for point in points[1:]:
-        is_duplicate = False
-        for existing in unique:
-            if (
-                abs(point[0] - existing[0]) < tolerance
-                and abs(point[1] - existing[1]) < tolerance
-            ):
-                is_duplicate = True
-                break
-        if not is_duplicate:
-            unique.append(point)
-    return unique
+    arr = np.asarray(points, dtype=np.float64)
+    keys = np.round(arr[:, :2] / tolerance).astype(np.int64)
+    # Stable lexsort keeps equal cells in input order, so the first row of each
+    # run of equal keys is the earliest point in that cell.
+    order = np.lexsort((keys[:, 1], keys[:, 0]))
+    sorted_keys = keys[order]
+    first = np.empty(len(order), dtype=bool)
+    first[0] = True
+    np.any(sorted_keys[1:] != sorted_keys[:-1], axis=1, out=first[1:])
+    idx = np.sort(order[first])
+    return arr[idx].tolist()
 
 
 # ---------------------------------------------------------------------------
@@ -9,14 +9,33 @@ Author: NODAL Compliance Team
 Version: 1.0.0
 """
 
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple, Union
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field, replace
 from enum import Enum
+import contextlib
+import functools
+import hashlib
+import io
 import json
+import math
+import operator
+import struct
+import sys
 from datetime import datetime
 
+try:
+    import numpy as np
+except ImportError:  # only needed by the vectorized batch path
+    np = None
 
-class RuleStatus(Enum):
+try:
+    import orjson
+except ImportError:  # JSON output falls back to the json module
+    orjson = None
+
+
+class RuleStatus(str, Enum):
     """Status values for rule compliance checks"""
     PASS = "PASS"
     FAIL = "FAIL"
@@ -25,14 +44,14 @@ class RuleStatus(Enum):
     ERROR = "ERROR"
 
 
-class Severity(Enum):
+class Severity(str, Enum):
     """Severity levels for compliance violations"""
     CRITICAL = "CRITICAL"  # Must be fixed for compliance
     WARNING = "WARNING"    # Should be reviewed
     INFO = "INFO"         # Informational only
 
 
-class OverallStatus(Enum):
+class OverallStatus(str, Enum):
     """Overall compliance status for a space"""
     PASS = "PASS"              # All applicable rules pass
     FAIL = "FAIL"              # One or more critical rules fail
@@ -40,7 +59,25 @@ class OverallStatus(Enum):
     ERROR = "ERROR"            # Error during checking
 
 
-@dataclass
+# Plain value per status/severity, for the per-rule output paths (to_dict,
+# the text report): Enum.value is a property, several times slower than a
+# dict hit
+_STATUS_VALUES = {status: status.value for status in RuleStatus}
+_SEVERITY_VALUES = {severity: severity.value for severity in Severity}
+
+
+class RuleSpec(NamedTuple):
+    """Definition of a BFS 2024:1 rule"""
+    id: str
+    name: str
+    reference: str  # BFS reference
+    severity: Severity
+    applies_to: FrozenSet[str]  # Lower-case space types the rule covers
+    description_en: str = ""
+    description_sv: str = ""
+
+
+@dataclass(slots=True, frozen=True)
 class RuleResult:
     """Result of a single rule check"""
     rule_id: str
@@ -55,14 +92,14 @@ class RuleResult:
         return {
             "rule_id": self.rule_id,
             "rule_name": self.rule_name,
-            "status": self.status.value,
+            "status": _STATUS_VALUES[self.status],
             "details": self.details,
-            "severity": self.severity.value,
+            "severity": _SEVERITY_VALUES[self.severity],
             "reference": self.reference
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ComplianceResult:
     """Complete compliance check result for a space"""
     space_id: str
@@ -77,17 +114,392 @@ class ComplianceResult:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary format"""
+        status_values, severity_values = _STATUS_VALUES, _SEVERITY_VALUES
         return {
             "space_id": self.space_id,
             "space_name": self.space_name,
             "space_type": self.space_type,
             "overall_status": self.overall_status.value,
-            "rules_checked": [rule.to_dict() for rule in self.rules_checked],
+            # RuleResult.to_dict inlined; this runs once per rule per space
+            "rules_checked": [
+                {
+                    "rule_id": rule.rule_id,
+                    "rule_name": rule.rule_name,
+                    "status": status_values[rule.status],
+                    "details": rule.details,
+                    "severity": severity_values[rule.severity],
+                    "reference": rule.reference
+                }
+                for rule in self.rules_checked
+            ],
             "passed_count": self.passed_count,
             "failed_count": self.failed_count,
             "not_checked_count": self.not_checked_count,
             "timestamp": self.timestamp
         }
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize to UTF-8 JSON (same shape as to_dict)"""
+        return dumps_json(self)
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode the types json/orjson don't handle natively"""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (RuleResult, ComplianceResult)):
+        return obj.to_dict()
+    if isinstance(obj, tuple):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_json(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize results (or structures containing them) to UTF-8 JSON.
+    
+    With orjson installed, dataclasses and enums are encoded directly
+    without building intermediate dicts; otherwise this goes through
+    to_dict and the json module.  Output has the same shape either way.
+    
+    Args:
+        obj: ComplianceResult, RuleResult, or a dict/list containing them
+        indent: Pretty-print with two-space indentation
+        
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            default=_json_default,
+            option=orjson.OPT_INDENT_2 if indent else 0
+        )
+    return json.dumps(
+        obj,
+        default=_json_default,
+        indent=2 if indent else None,
+        ensure_ascii=False
+    ).encode("utf-8")
+
+
+# Rule status codes used by the vectorized batch path (index into _STATUS_ORDER)
+_STATUS_ORDER = (
+    RuleStatus.PASS,
+    RuleStatus.FAIL,
+    RuleStatus.NOT_APPLICABLE,
+    RuleStatus.NOT_CHECKED,
+    RuleStatus.ERROR,
+)
+_PASS, _FAIL, _NOT_APPLICABLE, _NOT_CHECKED, _ERROR = range(len(_STATUS_ORDER))
+_STATUS_CODES = {status: code for code, status in enumerate(_STATUS_ORDER)}
+
+# Space fields read by the threshold rules.  Numeric fields are stored as
+# floats; flag fields (yes/no answers) as 1.0/0.0.
+_NUMERIC_FIELDS = (
+    "corridor_width_mm",
+    "ramp_slope_ratio",
+    "handrail_height_mm",
+    "elevator_width_mm",
+    "elevator_depth_mm",
+    "elevator_door_width_mm",
+    "emergency_exit_width_mm",
+    "stair_rise_mm",
+    "stair_run_mm",
+    "parking_width_mm",
+    "parking_length_mm",
+    "stair_width_mm",
+    "window_sill_height_mm",
+    "window_opening_width_mm",
+    "window_opening_height_mm",
+)
+_FLAG_FIELDS = (
+    "door_opens_outward",
+    "rest_area_25m_compliant",
+    "emergency_exit_door_opens_outward",
+    "stair_handrail_both_sides",
+    "tactile_guidance_present",
+)
+
+
+@dataclass(slots=True)
+class SpaceTable:
+    """
+    Column-oriented (structure-of-arrays) view of a list of spaces.
+    
+    Every rule input field becomes a float64 array aligned with spaces, with
+    NaN marking a missing value.  Requires numpy.
+    """
+    spaces: List[Dict[str, Any]]
+    types: Any
+    columns: Dict[str, Any]
+    
+    @classmethod
+    def from_spaces(cls, spaces: List[Dict[str, Any]]) -> "SpaceTable":
+        """
+        Build a table from space dictionaries (as returned by parser.py).
+        
+        Args:
+            spaces: Space dictionaries
+            
+        Returns:
+            SpaceTable with lower-cased types and one column per rule field
+            
+        Raises:
+            ImportError: If numpy is not installed
+        """
+        if np is None:
+            raise ImportError("SpaceTable requires numpy")
+        
+        # Each column is filled straight from a generator (no intermediate
+        # list); explicit None values count as missing like absent keys
+        nan = math.nan
+        count = len(spaces)
+        columns = {}
+        for name in _NUMERIC_FIELDS:
+            columns[name] = np.fromiter(
+                (nan if (v := space.get(name)) is None else v for space in spaces),
+                dtype=np.float64, count=count
+            )
+        for name in _FLAG_FIELDS:
+            columns[name] = np.fromiter(
+                (nan if (v := space.get(name)) is None else (1.0 if v else 0.0)
+                 for space in spaces),
+                dtype=np.float64, count=count
+            )
+        
+        types = np.array(
+            [space.get("type", "unknown").lower() for space in spaces],
+            dtype=object
+        )
+        return cls(spaces=list(spaces), types=types, columns=columns)
+
+
+@dataclass(slots=True)
+class CompactResults:
+    """
+    Rule outcomes for many spaces as an int8 status-code matrix.
+    
+    codes[i, j] is the _STATUS_ORDER index of rule j for space i; the
+    RuleResult for a cell is only built when asked for with materialize().
+    Returned by BFS2024ComplianceChecker.validate_compact.
+    """
+    codes: Any
+    table: SpaceTable
+    geometry_results: List[Optional[Dict[str, Any]]]
+    type_names: Any
+    type_index: Any
+    checker: "BFS2024ComplianceChecker"
+    scalar_results: Dict[Tuple[int, int], RuleResult] = field(repr=False)
+    
+    def status(self, i: int, j: int) -> RuleStatus:
+        """Status of rule j for space i."""
+        return _STATUS_ORDER[self.codes[i, j]]
+    
+    def materialize(self, i: int, j: int) -> RuleResult:
+        """
+        Full RuleResult of rule j for space i (as check_compliance would give).
+        
+        Args:
+            i: Space index
+            j: Rule index (position in checker.rules)
+            
+        Returns:
+            RuleResult with details
+        """
+        result = self.scalar_results.get((i, j))
+        if result is not None:
+            return result
+        
+        space_type = self.type_names[self.type_index[i]]
+        rule, check = self.checker._rule_checks[j]
+        code = self.codes[i, j]
+        if code == _NOT_APPLICABLE:
+            return self.checker._not_applicable_result(rule, space_type)
+        if code == _NOT_CHECKED:
+            return self.checker._missing_data_result(rule, check, space_type)
+        return check(self.table.spaces[i], self.geometry_results[i], space_type)
+
+
+def _threshold_codes(values, lo, hi, starts, applies):
+    """
+    Status codes for the threshold rules of many spaces (numpy version).
+    
+    Args:
+        values: (spaces, fields) float64 matrix, NaN where missing
+        lo, hi: Inclusive bounds per field
+        starts: Index of each rule's first field; fields are grouped by rule
+        applies: (spaces, rules) bool matrix of rule applicability
+        
+    Returns:
+        (spaces, rules) int8 matrix of _STATUS_ORDER codes
+    """
+    within = (values >= lo) & (values <= hi)
+    ok = np.logical_and.reduceat(within, starts, axis=1)
+    missing = np.logical_or.reduceat(np.isnan(values), starts, axis=1)
+    return np.where(
+        applies,
+        np.where(missing, _NOT_CHECKED, np.where(ok, _PASS, _FAIL)),
+        _NOT_APPLICABLE
+    ).astype(np.int8)
+
+
+# Below this many spaces numpy beats the Numba kernel's thread start-up
+_NUMBA_MIN_SPACES = 10_000
+
+
+@functools.lru_cache(maxsize=None)
+def _threshold_codes_numba() -> Optional[Callable]:
+    """
+    Compile a parallel Numba version of _threshold_codes.
+    
+    Numba is imported on first use so it doesn't slow down importing this
+    module; returns None when it isn't installed.  The compiled kernel is
+    cached on disk, so only the first run on a machine pays for the JIT.
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+    
+    @numba.njit(cache=True, parallel=True)
+    def kernel(values, lo, hi, starts, applies, out):
+        n_rules = starts.shape[0]
+        n_fields = values.shape[1]
+        for i in numba.prange(values.shape[0]):
+            for k in range(n_rules):
+                if not applies[i, k]:
+                    out[i, k] = _NOT_APPLICABLE
+                    continue
+                end = starts[k + 1] if k + 1 < n_rules else n_fields
+                missing = False
+                ok = True
+                for f in range(starts[k], end):
+                    v = values[i, f]
+                    if np.isnan(v):
+                        missing = True
+                    elif v < lo[f] or v > hi[f]:
+                        ok = False
+                if missing:
+                    out[i, k] = _NOT_CHECKED
+                elif ok:
+                    out[i, k] = _PASS
+                else:
+                    out[i, k] = _FAIL
+    
+    def threshold_codes(values, lo, hi, starts, applies):
+        out = np.empty(applies.shape, dtype=np.int8)
+        kernel(values, lo, hi, starts, applies, out)
+        return out
+    
+    return threshold_codes
+
+
+def _threshold_kernel(n_spaces: int) -> Callable:
+    """Pick the threshold evaluator for a batch of n_spaces."""
+    if n_spaces >= _NUMBA_MIN_SPACES:
+        compiled = _threshold_codes_numba()
+        if compiled is not None:
+            return compiled
+    return _threshold_codes
+
+
+def _result_factory(rule: RuleSpec) -> Callable[[RuleStatus, str], RuleResult]:
+    """Build RuleResults for one rule from just (status, details)."""
+    rule_id, rule_name = rule.id, rule.name
+    severity, reference = rule.severity, rule.reference
+    
+    def make_result(status: RuleStatus, details: str) -> RuleResult:
+        return RuleResult(rule_id, rule_name, status, details, severity, reference)
+    
+    return make_result
+
+
+def _boundary_digest(boundary: List[List[float]]) -> Optional[bytes]:
+    """
+    16-byte blake2b digest of a boundary's [x, y] points packed as float64.
+    
+    Returns None if a point isn't a pair of numbers.
+    """
+    try:
+        packed = struct.pack(
+            f"{2 * len(boundary)}d",
+            *[x for x, _ in boundary],
+            *[y for _, y in boundary]
+        )
+    except (TypeError, ValueError, struct.error):
+        return None
+    return hashlib.blake2b(packed, digest_size=16).digest()
+
+
+def _single_threshold_check(
+    rule_attr: str,
+    field_name: str,
+    label: str,
+    op: str,
+    limit: float,
+    missing_details: str,
+    doc: str
+) -> Callable[[Any, Dict[str, Any]], RuleResult]:
+    """
+    Build a check_*_rule method for a rule that compares one space field
+    against one limit (op is ">=" for a minimum, "<=" for a maximum).
+    
+    Details read e.g. "Stair width 1250mm >= required 1200mm. <description>"
+    or "Window sill height 650mm > max 600mm. <description>".
+    """
+    if op == ">=":
+        passes, pass_text, fail_text = operator.ge, ">= required", "< required"
+    elif op == "<=":
+        passes, pass_text, fail_text = operator.le, "<= max", "> max"
+    else:
+        raise ValueError(f"Unsupported threshold operator: {op}")
+    
+    def check(
+        self, space_dict: Dict[str, Any], space_type: Optional[str] = None
+    ) -> RuleResult:
+        rule = getattr(self, rule_attr)
+        if space_type is None:
+            space_type = space_dict.get("type", "").lower()
+        
+        if space_type not in rule.applies_to:
+            return self._not_applicable_result(rule, space_type)
+        
+        value = space_dict.get(field_name)
+        if value is None:
+            return self._not_checked_result(rule, missing_details)
+        
+        if passes(value, limit):
+            return self._result_factories[rule.id](
+                RuleStatus.PASS,
+                f"{label} {value:.0f}mm {pass_text} {limit}mm. {rule.description_en}"
+            )
+        return self._result_factories[rule.id](
+            RuleStatus.FAIL,
+            f"{label} {value:.0f}mm {fail_text} {limit}mm. {rule.description_en}"
+        )
+    
+    check.__name__ = f"check_{rule_attr[len('RULE_'):].lower()}_rule"
+    check.__qualname__ = f"BFS2024ComplianceChecker.{check.__name__}"
+    check.__doc__ = doc
+    return check
+
+
+def _ignore_geometry(
+    check: Callable[[Dict[str, Any], Optional[str]], RuleResult]
+) -> Callable[[Dict[str, Any], Optional[Dict[str, Any]], Optional[str]], RuleResult]:
+    """
+    Adapt a space-only rule check to the
+    (space_dict, geometry_result, space_type) signature.
+    """
+    def adapted(
+        space_dict: Dict[str, Any],
+        geometry_result: Optional[Dict[str, Any]] = None,
+        space_type: Optional[str] = None
+    ) -> RuleResult:
+        return check(space_dict, space_type)
+    adapted.__wrapped__ = check
+    return adapted
 
 
 class BFS2024ComplianceChecker:
@@ -99,202 +511,248 @@ class BFS2024ComplianceChecker:
     """
     
     # Rule definitions
-    RULE_TURNING_CIRCLE = {
-        "id": "BFS-2024:1-3:14",
-        "name": "Turning Circle (1500mm)",
-        "reference": "BFS 2024:1 Section 3:14",
-        "severity": Severity.CRITICAL,
-        "applies_to": ["bathroom", "wc", "toilet"]
-    }
+    RULE_TURNING_CIRCLE = RuleSpec(
+        id="BFS-2024:1-3:14",
+        name="Turning Circle (1500mm)",
+        reference="BFS 2024:1 Section 3:14",
+        severity=Severity.CRITICAL,
+        applies_to=frozenset({"bathroom", "wc", "toilet"})
+    )
     
-    RULE_DOOR_WIDTH = {
-        "id": "BFS-2024:1-3:15",
-        "name": "Door Width (900mm minimum)",
-        "reference": "BFS 2024:1 Section 3:15",
-        "severity": Severity.CRITICAL,
-        "applies_to": ["bathroom", "wc", "toilet"]
-    }
+    RULE_DOOR_WIDTH = RuleSpec(
+        id="BFS-2024:1-3:15",
+        name="Door Width (900mm minimum)",
+        reference="BFS 2024:1 Section 3:15",
+        severity=Severity.CRITICAL,
+        applies_to=frozenset({"bathroom", "wc", "toilet"})
+    )
     
-    RULE_THRESHOLD = {
-        "id": "BFS-2024:1-3:16",
-        "name": "Threshold Height (25mm max)",
-        "reference": "BFS 2024:1 Section 3:16",
-        "severity": Severity.WARNING,
-        "applies_to": ["bathroom", "wc", "toilet", "entrance"]
-    }
+    RULE_THRESHOLD = RuleSpec(
+        id="BFS-2024:1-3:16",
+        name="Threshold Height (25mm max)",
+        reference="BFS 2024:1 Section 3:16",
+        severity=Severity.WARNING,
+        applies_to=frozenset({"bathroom", "wc", "toilet", "entrance"})
+    )
     
-    RULE_CORRIDOR_WIDTH = {
-        "id": "BFS-2024:1-3:22",
-        "name": "Corridor Width (1300mm minimum)",
-        "reference": "BFS 2024:1 Section 3:22",
-        "severity": Severity.CRITICAL,
-        "applies_to": ["corridor", "circulation", "passage", "hallway", "korridor"],
-        "description_en": "Minimum clear width 1300mm for accessibility.",
-        "description_sv": "Minst 1300 mm fri bredd för tillgänglighet."
-    }
+    RULE_CORRIDOR_WIDTH = RuleSpec(
+        id="BFS-2024:1-3:22",
+        name="Corridor Width (1300mm minimum)",
+        reference="BFS 2024:1 Section 3:22",
+        severity=Severity.CRITICAL,
+        applies_to=frozenset({"corridor", "circulation", "passage", "hallway", "korridor"}),
+        description_en="Minimum clear width 1300mm for accessibility.",
+        description_sv="Minst 1300 mm fri bredd för tillgänglighet."
+    )
     
-    RULE_RAMP_SLOPE = {
-        "id": "BFS-2024:1-3:231",
-        "name": "Ramp Slope (max 1:12 / 8.33%)",
-        "reference": "BFS 2024:1 Section 3:231",
-        "severity": Severity.CRITICAL,
-        "applies_to": ["ramp", "rampway"],
-        "description_en": "Maximum slope 1:12 (8.33%) for ramps.",
-        "description_sv": "Maximal lutning 1:12 (8,33 %) för ramper."
-    }
+    RULE_RAMP_SLOPE = RuleSpec(
+        id="BFS-2024:1-3:231",
+        name="Ramp Slope (max 1:12 / 8.33%)",
+        reference="BFS 2024:1 Section 3:231",
+        severity=Severity.CRITICAL,
+        applies_to=frozenset({"ramp", "rampway"}),
+        description_en="Maximum slope 1:12 (8.33%) for ramps.",
+        description_sv="Maximal lutning 1:12 (8,33 %) för ramper."
+    )
     
-    RULE_HANDRAIL_HEIGHT = {
-        "id": "BFS-2024:1-3:232",
-        "name": "Handrail Height (900–1000mm)",
-        "reference": "BFS 2024:1 Section 3:232",
-        "severity": Severity.CRITICAL,
-        "applies_to": ["ramp", "stair", "stairs", "trappa"],
-        "description_en": "Handrail height must be between 900mm and 1000mm.",
-        "description_sv": "Räckeshöjd ska vara 900–1000 mm."
-    }
+    RULE_HANDRAIL_HEIGHT = RuleSpec(
+        id="BFS-2024:1-3:232",
+        name="Handrail Height (900–1000mm)",
+        reference="BFS 2024:1 Section 3:232",
+        severity=Severity.CRITICAL,
+        applies_to=frozenset({"ramp", "stair", "stairs", "trappa"}),
+        description_en="Handrail height must be between 900mm and 1000mm.",
+        description_sv="Räckeshöjd ska vara 900–1000 mm."
+    )
     
-    RULE_BATHROOM_DOOR_SWING = {
-        "id": "BFS-2024:1-3:241",
-        "name": "Bathroom Door Opens Outward",
-        "reference": "BFS 2024:1 Section 3:241",
-        "severity": Severity.CRITICAL,
-        "applies_to": ["bathroom", "wc", "toilet"],
-        "description_en": "Bathroom door must open outward for emergency access.",
-        "description_sv": "Dörr till badrum/toalett ska öppnas utåt för nödutrymning."
-    }
+    RULE_BATHROOM_DOOR_SWING = RuleSpec(
+        id="BFS-2024:1-3:241",
+        name="Bathroom Door Opens Outward",
+        reference="BFS 2024:1 Section 3:241",
+        severity=Severity.CRITICAL,
+        applies_to=frozenset({"bathroom", "wc", "toilet"}),
+        description_en="Bathroom door must open outward for emergency access.",
+        description_sv="Dörr till badrum/toalett ska öppnas utåt för nödutrymning."
+    )
     
-    RULE_REST_AREA_25M = {
-        "id": "BFS-2024:1-3:311",
-        "name": "Rest Area Every 25m (corridors)",
-        "reference": "BFS 2024:1 Section 3:311",
-        "severity": Severity.WARNING,
-        "applies_to": ["corridor", "circulation", "passage", "hallway", "korridor"],
-        "description_en": "Rest area or widening required at least every 25m in corridors.",
-        "description_sv": "Viloplats eller breddning minst var 25:e meter i korridorer."
-    }
+    RULE_REST_AREA_25M = RuleSpec(
+        id="BFS-2024:1-3:311",
+        name="Rest Area Every 25m (corridors)",
+        reference="BFS 2024:1 Section 3:311",
+        severity=Severity.WARNING,
+        applies_to=frozenset({"corridor", "circulation", "passage", "hallway", "korridor"}),
+        description_en="Rest area or widening required at least every 25m in corridors.",
+        description_sv="Viloplats eller breddning minst var 25:e meter i korridorer."
+    )
     
-    RULE_ELEVATOR_SIZE = {
-        "id": "BFS-2024:1-3:143",
-        "name": "Elevator Minimum Size (1100mm x 1400mm)",
-        "reference": "BFS 2024:1 Section 3:143",
-        "severity": Severity.CRITICAL,
-        "applies_to": ["elevator", "lift", "hiss"],
-        "description_en": "Elevator cabin minimum clear dimensions 1100mm x 1400mm.",
-        "description_sv": "Hisskupans minsta fria mått 1100 mm x 1400 mm."
-    }
+    RULE_ELEVATOR_SIZE = RuleSpec(
+        id="BFS-2024:1-3:143",
+        name="Elevator Minimum Size (1100mm x 1400mm)",
+        reference="BFS 2024:1 Section 3:143",
+        severity=Severity.CRITICAL,
+        applies_to=frozenset({"elevator", "lift", "hiss"}),
+        description_en="Elevator cabin minimum clear dimensions 1100mm x 1400mm.",
+        description_sv="Hisskupans minsta fria mått 1100 mm x 1400 mm."
+    )
     
-    RULE_ELEVATOR_DOOR_WIDTH = {
-        "id": "BFS-2024:1-3:144",
-        "name": "Elevator Door Width (800mm minimum)",
-        "reference": "BFS 2024:1 Section 3:144",
-        "severity": Severity.CRITICAL,
-        "applies_to": ["elevator", "lift", "hiss"],
-        "description_en": "Elevator door clear width minimum 800mm.",
-        "description_sv": "Hissdörrens fria bredd minst 800 mm."
-    }
+    RULE_ELEVATOR_DOOR_WIDTH = RuleSpec(
+        id="BFS-2024:1-3:144",
+        name="Elevator Door Width (800mm minimum)",
+        reference="BFS 2024:1 Section 3:144",
+        severity=Severity.CRITICAL,
+        applies_to=frozenset({"elevator", "lift", "hiss"}),
+        description_en="Elevator door clear width minimum 800mm.",
+        description_sv="Hissdörrens fria bredd minst 800 mm."
+    )
     
-    RULE_EMERGENCY_EXIT_WIDTH = {
-        "id": "BFS-2024:1-3:51",
-        "name": "Emergency Exit Width (900mm minimum)",
-        "reference": "BFS 2024:1 Section 3:51",
-        "severity": Severity.CRITICAL,
-        "applies_to": ["emergency_exit", "exit", "nödutgång", "utgång", "emergency", "evacuation"],
-        "description_en": "Emergency exit clear width minimum 900mm.",
-        "description_sv": "Nödutgångens fria bredd minst 900 mm."
-    }
+    RULE_EMERGENCY_EXIT_WIDTH = RuleSpec(
+        id="BFS-2024:1-3:51",
+        name="Emergency Exit Width (900mm minimum)",
+        reference="BFS 2024:1 Section 3:51",
+        severity=Severity.CRITICAL,
+        applies_to=frozenset({"emergency_exit", "exit", "nödutgång", "utgång", "emergency", "evacuation"}),
+        description_en="Emergency exit clear width minimum 900mm.",
+        description_sv="Nödutgångens fria bredd minst 900 mm."
+    )
     
-    RULE_EMERGENCY_EXIT_DOOR_SWING = {
-        "id": "BFS-2024:1-3:52",
-        "name": "Emergency Exit Door Opens Outward",
-        "reference": "BFS 2024:1 Section 3:52",
-        "severity": Severity.CRITICAL,
-        "applies_to": ["emergency_exit", "exit", "nödutgång", "utgång", "emergency", "evacuation"],
-        "description_en": "Emergency exit door must open outward for evacuation.",
-        "description_sv": "Nödutgångens dörr ska öppnas utåt för evakuering."
-    }
+    RULE_EMERGENCY_EXIT_DOOR_SWING = RuleSpec(
+        id="BFS-2024:1-3:52",
+        name="Emergency Exit Door Opens Outward",
+        reference="BFS 2024:1 Section 3:52",
+        severity=Severity.CRITICAL,
+        applies_to=frozenset({"emergency_exit", "exit", "nödutgång", "utgång", "emergency", "evacuation"}),
+        description_en="Emergency exit door must open outward for evacuation.",
+        description_sv="Nödutgångens dörr ska öppnas utåt för evakuering."
+    )
     
-    RULE_STAIR_DIMENSIONS = {
-        "id": "BFS-2024:1-3:421",
-        "name": "Stair Step Height (max 150mm) and Depth (min 300mm)",
-        "reference": "BFS 2024:1 Section 3:421",
-        "severity": Severity.CRITICAL,
-        "applies_to": ["stair", "stairs", "trappa"],
-        "description_en": "Step rise maximum 150mm, step run minimum 300mm.",
-        "description_sv": "Steghöjden max 150 mm, stegbredden minst 300 mm."
-    }
+    RULE_STAIR_DIMENSIONS = RuleSpec(
+        id="BFS-2024:1-3:421",
+        name="Stair Step Height (max 150mm) and Depth (min 300mm)",
+        reference="BFS 2024:1 Section 3:421",
+        severity=Severity.CRITICAL,
+        applies_to=frozenset({"stair", "stairs", "trappa"}),
+        description_en="Step rise maximum 150mm, step run minimum 300mm.",
+        description_sv="Steghöjden max 150 mm, stegbredden minst 300 mm."
+    )
     
-    RULE_PARKING_WIDTH = {
-        "id": "BFS-2024:1-3:131",
-        "name": "Accessible Parking Space Width (3600mm minimum)",
-        "reference": "BFS 2024:1 Section 3:131",
-        "severity": Severity.CRITICAL,
-        "applies_to": ["parking", "parkeringsplats", "accessible_parking", "parking_space"],
-        "description_en": "Accessible parking space minimum clear width 3600mm.",
-        "description_sv": "Tillgänglig parkeringsplats minst 3600 mm bred."
-    }
+    RULE_PARKING_WIDTH = RuleSpec(
+        id="BFS-2024:1-3:131",
+        name="Accessible Parking Space Width (3600mm minimum)",
+        reference="BFS 2024:1 Section 3:131",
+        severity=Severity.CRITICAL,
+        applies_to=frozenset({"parking", "parkeringsplats", "accessible_parking", "parking_space"}),
+        description_en="Accessible parking space minimum clear width 3600mm.",
+        description_sv="Tillgänglig parkeringsplats minst 3600 mm bred."
+    )
     
-    RULE_PARKING_LENGTH = {
-        "id": "BFS-2024:1-3:132",
-        "name": "Parking Space Length (5000mm minimum)",
-        "reference": "BFS 2024:1 Section 3:132",
-        "severity": Severity.CRITICAL,
-        "applies_to": ["parking", "parkeringsplats", "accessible_parking", "parking_space"],
-        "description_en": "Parking space length minimum 5000mm.",
-        "description_sv": "Parkeringsplatsens längd minst 5000 mm."
-    }
+    RULE_PARKING_LENGTH = RuleSpec(
+        id="BFS-2024:1-3:132",
+        name="Parking Space Length (5000mm minimum)",
+        reference="BFS 2024:1 Section 3:132",
+        severity=Severity.CRITICAL,
+        applies_to=frozenset({"parking", "parkeringsplats", "accessible_parking", "parking_space"}),
+        description_en="Parking space length minimum 5000mm.",
+        description_sv="Parkeringsplatsens längd minst 5000 mm."
+    )
     
-    RULE_STAIR_HANDRAIL_BOTH = {
-        "id": "BFS-2024:1-3:411",
-        "name": "Stair Handrail Both Sides Required",
-        "reference": "BFS 2024:1 Section 3:411",
-        "severity": Severity.CRITICAL,
-        "applies_to": ["stair", "stairs", "trappa"],
-        "description_en": "Stairs must have handrails on both sides.",
-        "description_sv": "Trappor ska ha räcken på båda sidor."
-    }
+    RULE_STAIR_HANDRAIL_BOTH = RuleSpec(
+        id="BFS-2024:1-3:411",
+        name="Stair Handrail Both Sides Required",
+        reference="BFS 2024:1 Section 3:411",
+        severity=Severity.CRITICAL,
+        applies_to=frozenset({"stair", "stairs", "trappa"}),
+        description_en="Stairs must have handrails on both sides.",
+        description_sv="Trappor ska ha räcken på båda sidor."
+    )
     
-    RULE_STAIR_WIDTH = {
-        "id": "BFS-2024:1-3:412",
-        "name": "Stair Width (1200mm minimum)",
-        "reference": "BFS 2024:1 Section 3:412",
-        "severity": Severity.CRITICAL,
-        "applies_to": ["stair", "stairs", "trappa"],
-        "description_en": "Stair clear width minimum 1200mm.",
-        "description_sv": "Trappans fria bredd minst 1200 mm."
-    }
+    RULE_STAIR_WIDTH = RuleSpec(
+        id="BFS-2024:1-3:412",
+        name="Stair Width (1200mm minimum)",
+        reference="BFS 2024:1 Section 3:412",
+        severity=Severity.CRITICAL,
+        applies_to=frozenset({"stair", "stairs", "trappa"}),
+        description_en="Stair clear width minimum 1200mm.",
+        description_sv="Trappans fria bredd minst 1200 mm."
+    )
     
-    RULE_WINDOW_SILL_HEIGHT = {
-        "id": "BFS-2024:1-3:531",
-        "name": "Window Sill Height (max 600mm from floor)",
-        "reference": "BFS 2024:1 Section 3:531",
-        "severity": Severity.WARNING,
-        "applies_to": ["window", "fönster", "room", "rum", "space"],
-        "description_en": "Window sill height maximum 600mm from floor level.",
-        "description_sv": "Fönsterbrädans höjd max 600 mm från golvnivå."
-    }
+    RULE_WINDOW_SILL_HEIGHT = RuleSpec(
+        id="BFS-2024:1-3:531",
+        name="Window Sill Height (max 600mm from floor)",
+        reference="BFS 2024:1 Section 3:531",
+        severity=Severity.WARNING,
+        applies_to=frozenset({"window", "fönster", "room", "rum", "space"}),
+        description_en="Window sill height maximum 600mm from floor level.",
+        description_sv="Fönsterbrädans höjd max 600 mm från golvnivå."
+    )
     
-    RULE_WINDOW_OPENING_SIZE = {
-        "id": "BFS-2024:1-3:532",
-        "name": "Window Opening (min 900mm x 1200mm)",
-        "reference": "BFS 2024:1 Section 3:532",
-        "severity": Severity.WARNING,
-        "applies_to": ["window", "fönster", "room", "rum", "space"],
-        "description_en": "Window opening minimum 900mm x 1200mm for emergency access.",
-        "description_sv": "Fönsteröppning minst 900 mm x 1200 mm för nödutrymning."
-    }
+    RULE_WINDOW_OPENING_SIZE = RuleSpec(
+        id="BFS-2024:1-3:532",
+        name="Window Opening (min 900mm x 1200mm)",
+        reference="BFS 2024:1 Section 3:532",
+        severity=Severity.WARNING,
+        applies_to=frozenset({"window", "fönster", "room", "rum", "space"}),
+        description_en="Window opening minimum 900mm x 1200mm for emergency access.",
+        description_sv="Fönsteröppning minst 900 mm x 1200 mm för nödutrymning."
+    )
     
-    RULE_TACTILE_GUIDANCE = {
-        "id": "BFS-2024:1-3:611",
-        "name": "Tactile Floor Guidance (visually impaired)",
-        "reference": "BFS 2024:1 Section 3:611",
-        "severity": Severity.WARNING,
-        "applies_to": ["corridor", "circulation", "passage", "hallway", "korridor", "public", "offentlig", "lobby", "entrance"],
-        "description_en": "Tactile floor guidance required for visually impaired in public areas.",
-        "description_sv": "Taktil golvledning krävs för synskadade i offentliga områden."
-    }
+    RULE_TACTILE_GUIDANCE = RuleSpec(
+        id="BFS-2024:1-3:611",
+        name="Tactile Floor Guidance (visually impaired)",
+        reference="BFS 2024:1 Section 3:611",
+        severity=Severity.WARNING,
+        applies_to=frozenset({"corridor", "circulation", "passage", "hallway", "korridor", "public", "offentlig", "lobby", "entrance"}),
+        description_en="Tactile floor guidance required for visually impaired in public areas.",
+        description_sv="Taktil golvledning krävs för synskadade i offentliga områden."
+    )
+    
+    # Rules that reduce to "every field within [lo, hi]" once their inputs
+    # are present, for the vectorized batch path.  Flag fields pass at 1.0.
+    _THRESHOLD_SPECS = (
+        (RULE_CORRIDOR_WIDTH, (("corridor_width_mm", 1300, math.inf),)),
+        (RULE_RAMP_SLOPE, (("ramp_slope_ratio", -math.inf, 1 / 12),)),
+        (RULE_HANDRAIL_HEIGHT, (("handrail_height_mm", 900, 1000),)),
+        (RULE_BATHROOM_DOOR_SWING, (("door_opens_outward", 1, math.inf),)),
+        (RULE_REST_AREA_25M, (("rest_area_25m_compliant", 1, math.inf),)),
+        (RULE_ELEVATOR_SIZE, (
+            ("elevator_width_mm", 1100, math.inf),
+            ("elevator_depth_mm", 1400, math.inf),
+        )),
+        (RULE_ELEVATOR_DOOR_WIDTH, (("elevator_door_width_mm", 800, math.inf),)),
+        (RULE_EMERGENCY_EXIT_WIDTH, (("emergency_exit_width_mm", 900, math.inf),)),
+        (RULE_EMERGENCY_EXIT_DOOR_SWING, (
+            ("emergency_exit_door_opens_outward", 1, math.inf),
+        )),
+        (RULE_STAIR_DIMENSIONS, (
+            ("stair_rise_mm", -math.inf, 150),
+            ("stair_run_mm", 300, math.inf),
+        )),
+        (RULE_PARKING_WIDTH, (("parking_width_mm", 3600, math.inf),)),
+        (RULE_PARKING_LENGTH, (("parking_length_mm", 5000, math.inf),)),
+        (RULE_STAIR_HANDRAIL_BOTH, (("stair_handrail_both_sides", 1, math.inf),)),
+        (RULE_STAIR_WIDTH, (("stair_width_mm", 1200, math.inf),)),
+        (RULE_WINDOW_SILL_HEIGHT, (("window_sill_height_mm", -math.inf, 600),)),
+        (RULE_WINDOW_OPENING_SIZE, (
+            ("window_opening_width_mm", 900, math.inf),
+            ("window_opening_height_mm", 1200, math.inf),
+        )),
+        (RULE_TACTILE_GUIDANCE, (("tactile_guidance_present", 1, math.inf),)),
+    )
+    
+    _REQUIRED_SPACE_FIELDS = frozenset(("id", "type"))
     
-    def __init__(self):
-        """Initialize the compliance checker"""
+    def __init__(self, cache_size: int = 0):
+        """
+        Initialize the compliance checker.
+        
+        Args:
+            cache_size: Number of recent ComplianceResults memoized by input
+                fingerprint (default 0 disables the cache).  Worth enabling
+                only when the same spaces are checked repeatedly; for models
+                where most spaces are unique, fingerprinting costs more than
+                the hits save.
+        """
+        self._cache_size = cache_size
+        self._result_cache: "OrderedDict[Tuple, ComplianceResult]" = OrderedDict()
         self.rules = [
             self.RULE_TURNING_CIRCLE,
             self.RULE_DOOR_WIDTH,
@@ -317,18 +775,205 @@ class BFS2024ComplianceChecker:
             self.RULE_WINDOW_OPENING_SIZE,
             self.RULE_TACTILE_GUIDANCE,
         ]
+        
+        # Checker for each rule, in the same order as self.rules.  All take
+        # (space_dict, geometry_result, space_type) so check_compliance can
+        # dispatch uniformly and lower-case the type only once per space;
+        # only the turning circle uses the geometry.
+        self._rule_checks = tuple(zip(self.rules, (
+            self.check_turning_circle_rule,
+            *(
+                _ignore_geometry(check) for check in (
+                    self.check_door_width_rule,
+                    self.check_threshold_rule,
+                    self.check_corridor_width_rule,
+                    self.check_ramp_slope_rule,
+                    self.check_handrail_height_rule,
+                    self.check_bathroom_door_swing_rule,
+                    self.check_rest_area_25m_rule,
+                    self.check_elevator_size_rule,
+                    self.check_elevator_door_width_rule,
+                    self.check_emergency_exit_width_rule,
+                    self.check_emergency_exit_door_swing_rule,
+                    self.check_stair_dimensions_rule,
+                    self.check_parking_width_rule,
+                    self.check_parking_length_rule,
+                    self.check_stair_handrail_both_rule,
+                    self.check_stair_width_rule,
+                    self.check_window_sill_height_rule,
+                    self.check_window_opening_size_rule,
+                    self.check_tactile_guidance_rule,
+                )
+            ),
+        )))
+        
+        # rule id -> (status, details) -> RuleResult, with the rule's
+        # constant fields bound once
+        self._result_factories: Dict[str, Callable[[RuleStatus, str], RuleResult]] = {
+            rule.id: _result_factory(rule) for rule in self.rules
+        }
+        
+        # space_type -> (rule, check) pairs in report order, with check set
+        # to None where the rule does not apply.  Known types are indexed
+        # up front; other types are added on first use.
+        self._not_applicable: Dict[Tuple[str, str], RuleResult] = {}
+        self._not_checked: Dict[str, RuleResult] = {}
+        self._errors: Dict[Tuple[str, str], RuleResult] = {}
+        self._rules_by_type: Dict[str, Tuple[Tuple[RuleSpec, Optional[Callable]], ...]] = {}
+        self._plans: Dict[str, Tuple[Tuple[Optional[Callable], bool, Optional[RuleResult]], ...]] = {}
+        for rule in self.rules:
+            for space_type in rule.applies_to:
+                self._rules_for_type(space_type)
+        
+        # Flattened threshold specs for the vectorized batch path: one entry
+        # per (rule, field), grouped by rule.  _threshold_starts[k] is where
+        # the fields of rule _threshold_rules[k] begin.
+        self._threshold_rules = tuple(
+            self.rules.index(rule) for rule, _ in self._THRESHOLD_SPECS
+        )
+        self._threshold_fields = tuple(
+            name for _, bounds in self._THRESHOLD_SPECS for name, _, _ in bounds
+        )
+        self._threshold_lo = tuple(
+            lo for _, bounds in self._THRESHOLD_SPECS for _, lo, _ in bounds
+        )
+        self._threshold_hi = tuple(
+            hi for _, bounds in self._THRESHOLD_SPECS for _, _, hi in bounds
+        )
+        starts = [0]
+        for _, bounds in self._THRESHOLD_SPECS[:-1]:
+            starts.append(starts[-1] + len(bounds))
+        self._threshold_starts = tuple(starts)
+    
+    def _rules_for_type(
+        self, space_type: str
+    ) -> Tuple[Tuple[RuleSpec, Optional[Callable]], ...]:
+        """Return the cached (rule, check) plan for a space type."""
+        plan = self._rules_by_type.get(space_type)
+        if plan is None:
+            plan = tuple(
+                (rule, check if space_type in rule.applies_to else None)
+                for rule, check in self._rule_checks
+            )
+            self._rules_by_type[space_type] = plan
+        return plan
+    
+    def _plan_for_type(
+        self, space_type: str
+    ) -> Tuple[Tuple[Optional[Callable], bool, Optional[RuleResult]], ...]:
+        """
+        Return the cached evaluation plan for a space type.
+        
+        One (check, uses_geometry, not_applicable) entry per rule in report
+        order.  Applicable rules carry their bound check (space-only checks
+        unwrapped from the geometry adapter, with uses_geometry False); the
+        others carry None and their shared NOT_APPLICABLE result.
+        """
+        plan = self._plans.get(space_type)
+        if plan is None:
+            entries = []
+            for rule, check in self._rules_for_type(space_type):
+                if check is None:
+                    entries.append(
+                        (None, False, self._not_applicable_result(rule, space_type))
+                    )
+                elif hasattr(check, "__wrapped__"):
+                    entries.append((check.__wrapped__, False, None))
+                else:
+                    entries.append((check, True, None))
+            plan = self._plans[space_type] = tuple(entries)
+        return plan
+    
+    def _not_checked_result(self, rule: RuleSpec, details: str) -> RuleResult:
+        """
+        NOT_CHECKED result for a rule whose input data is missing.
+        
+        Each rule has one fixed missing-data message, so one shared
+        instance per rule is built and reused.
+        """
+        result = self._not_checked.get(rule.id)
+        if result is None:
+            result = RuleResult(
+                rule_id=rule.id,
+                rule_name=rule.name,
+                status=RuleStatus.NOT_CHECKED,
+                details=details,
+                severity=rule.severity,
+                reference=rule.reference
+            )
+            self._not_checked[rule.id] = result
+        return result
+    
+    def _missing_data_result(
+        self, rule: RuleSpec, check: Callable, space_type: str
+    ) -> RuleResult:
+        """
+        Shared NOT_CHECKED result of a threshold rule, for the vectorized
+        paths (where NaN inputs count as missing too).
+        
+        The rule's check is only run, with all its fields absent, the first
+        time its missing-data message is needed.
+        """
+        result = self._not_checked.get(rule.id)
+        if result is None:
+            result = check({}, None, space_type)
+        return result
+    
+    def _error_result(self, rule: RuleSpec, details: str) -> RuleResult:
+        """
+        ERROR result for a rule whose input is unusable.
+        
+        The error messages are fixed strings, so one shared instance per
+        (rule, message) is built and reused.
+        """
+        key = (rule.id, details)
+        result = self._errors.get(key)
+        if result is None:
+            result = self._errors[key] = self._result_factories[rule.id](
+                RuleStatus.ERROR, details
+            )
+        return result
+    
+    def _not_applicable_result(
+        self, rule: RuleSpec, space_type: str
+    ) -> RuleResult:
+        """
+        NOT_APPLICABLE result for a rule that does not cover space_type.
+        
+        The result only depends on (rule, space_type), so one shared
+        instance per pair is built and reused.
+        """
+        key = (rule.id, space_type)
+        result = self._not_applicable.get(key)
+        if result is None:
+            result = RuleResult(
+                rule_id=rule.id,
+                rule_name=rule.name,
+                status=RuleStatus.NOT_APPLICABLE,
+                details=f"Rule does not apply to space type: {space_type}",
+                severity=rule.severity,
+                reference=rule.reference
+            )
+            self._not_applicable[key] = result
+        return result
     
     def check_compliance(
         self, 
         space_dict: Dict[str, Any], 
-        geometry_result: Optional[Dict[str, Any]] = None
+        geometry_result: Optional[Dict[str, Any]] = None,
+        timestamp: Optional[str] = None
     ) -> ComplianceResult:
         """
         Main compliance checking function.
         
+        Results are deterministic, so with a cache_size they are memoized by
+        a fingerprint of (space_dict, geometry_result); a cache hit only
+        refreshes the timestamp and the space's id and name.
+        
         Args:
             space_dict: Space information from parser.py
             geometry_result: Geometry check result from geometry.py (optional)
+            timestamp: ISO timestamp to stamp the result with (default: now)
             
         Returns:
             ComplianceResult object with all rule checks
@@ -339,121 +984,428 @@ class BFS2024ComplianceChecker:
         # Validate input
         self._validate_space_dict(space_dict)
         
-        space_id = space_dict.get("id", "unknown")
-        space_name = space_dict.get("name", "Unnamed Space")
-        space_type = space_dict.get("type", "unknown").lower()
+        if timestamp is None:
+            timestamp = datetime.now().isoformat()
         
-        # Run all applicable rules
-        rule_results = []
-        
-        # Rule 1: Turning Circle
-        rule_results.append(
-            self.check_turning_circle_rule(space_dict, geometry_result)
-        )
-        
-        # Rule 2: Door Width
-        rule_results.append(
-            self.check_door_width_rule(space_dict)
+        key = (
+            self._fingerprint(space_dict, geometry_result)
+            if self._cache_size > 0 else None
         )
+        if key is not None:
+            cached = self._result_cache.get(key)
+            if cached is not None:
+                self._result_cache.move_to_end(key)
+                return replace(
+                    cached,
+                    space_id=space_dict.get("id", "unknown"),
+                    space_name=space_dict.get("name", "Unnamed Space"),
+                    rules_checked=list(cached.rules_checked),
+                    timestamp=timestamp
+                )
+        
+        result = self._evaluate(space_dict, geometry_result, timestamp)
+        
+        if key is not None:
+            # Cache an immutable copy so callers can't alter cached results
+            self._result_cache[key] = replace(
+                result, rules_checked=tuple(result.rules_checked)
+            )
+            if len(self._result_cache) > self._cache_size:
+                self._result_cache.popitem(last=False)
         
-        # Rule 3: Threshold Height
-        rule_results.append(
-            self.check_threshold_rule(space_dict)
-        )
+        return result
+    
+    def check_compliance_batch(
+        self,
+        spaces: List[Dict[str, Any]],
+        geometry_results: Optional[List[Optional[Dict[str, Any]]]] = None
+    ) -> List[ComplianceResult]:
+        """
+        Check many spaces, stamping all results with one shared timestamp.
         
-        # Rule 4: Corridor Width (3:22)
-        rule_results.append(
-            self.check_corridor_width_rule(space_dict)
-        )
+        Args:
+            spaces: Space dictionaries from parser.py
+            geometry_results: Geometry results aligned with spaces (optional)
+            
+        Returns:
+            ComplianceResult per space, in input order
+            
+        Raises:
+            ValueError: If a space is invalid or the lists differ in length
+        """
+        if geometry_results is None:
+            geometry_results = [None] * len(spaces)
+        elif len(geometry_results) != len(spaces):
+            raise ValueError(
+                f"Got {len(geometry_results)} geometry results for {len(spaces)} spaces"
+            )
         
-        # Rule 5: Ramp Slope (3:231)
-        rule_results.append(
-            self.check_ramp_slope_rule(space_dict)
-        )
+        timestamp = datetime.now().isoformat()
+        return [
+            self.check_compliance(space, geometry, timestamp)
+            for space, geometry in zip(spaces, geometry_results)
+        ]
+    
+    def check_compliance_many(
+        self,
+        spaces: Union[List[Dict[str, Any]], SpaceTable],
+        geometry_results: Optional[List[Optional[Dict[str, Any]]]] = None
+    ) -> List[ComplianceResult]:
+        """
+        Vectorized check_compliance_batch for whole-building inputs.
         
-        # Rule 6: Handrail Height (3:232)
-        rule_results.append(
-            self.check_handrail_height_rule(space_dict)
-        )
+        Threshold rules are evaluated column-wise over a SpaceTable, so
+        NOT_APPLICABLE and NOT_CHECKED cells never touch the per-space rule
+        code; only present values are formatted per space, and the counts
+        and overall status come from one status-code matrix.  Results match
+        check_compliance_batch except that NaN inputs count as missing.  The
+        result cache is bypassed.  Without numpy this is check_compliance_batch.
         
-        # Rule 7: Bathroom Door Opens Outward (3:241)
-        rule_results.append(
-            self.check_bathroom_door_swing_rule(space_dict)
-        )
+        Args:
+            spaces: Space dictionaries from parser.py, or a SpaceTable
+            geometry_results: Geometry results aligned with spaces (optional)
+            
+        Returns:
+            ComplianceResult per space, in input order
+            
+        Raises:
+            ValueError: If a space is invalid or the lists differ in length
+        """
+        if not isinstance(spaces, SpaceTable) and np is None:
+            return self.check_compliance_batch(spaces, geometry_results)
         
-        # Rule 8: Rest Area Every 25m (3:311)
-        rule_results.append(
-            self.check_rest_area_25m_rule(space_dict)
+        table, geometry_results = self._prepare_many(spaces, geometry_results)
+        spaces = table.spaces
+        codes, type_names, type_index, scalar_results = self._status_matrix(
+            table, geometry_results
         )
-        
-        # Rule 9: Elevator Minimum Size (3:143)
-        rule_results.append(
-            self.check_elevator_size_rule(space_dict)
+        n_rules = len(self.rules)
+        timestamp = datetime.now().isoformat()
+        
+        # Build the RuleResult lists
+        threshold_rules = set(self._threshold_rules)
+        code_rows = codes.tolist()
+        all_results = []
+        for i, (space, geometry, t) in enumerate(
+            zip(spaces, geometry_results, type_index.tolist())
+        ):
+            space_type = type_names[t]
+            row = code_rows[i]
+            rule_results: List[RuleResult] = [None] * n_rules
+            for j, (rule, check) in enumerate(self._rules_for_type(space_type)):
+                if check is None:
+                    rule_results[j] = self._not_applicable_result(rule, space_type)
+                elif j not in threshold_rules:
+                    rule_results[j] = scalar_results[i, j]
+                elif row[j] == _NOT_CHECKED:
+                    # Missing-data results don't depend on the space
+                    rule_results[j] = self._missing_data_result(rule, check, space_type)
+                else:
+                    rule_results[j] = check(space, geometry, space_type)
+            all_results.append(rule_results)
+        
+        counts = self._row_status_counts(codes)
+        overall_index = self._overall_status_index(codes, counts).tolist()
+        overall_order = (
+            OverallStatus.ERROR,
+            OverallStatus.FAIL,
+            OverallStatus.PARTIAL,
+            OverallStatus.PASS,
         )
         
-        # Rule 10: Elevator Door Width (3:144)
-        rule_results.append(
-            self.check_elevator_door_width_rule(space_dict)
-        )
+        return [
+            ComplianceResult(
+                space_id=space.get("id", "unknown"),
+                space_name=space.get("name", "Unnamed Space"),
+                space_type=type_names[t],
+                overall_status=overall_order[status],
+                rules_checked=rule_results,
+                passed_count=row_counts[_PASS],
+                failed_count=row_counts[_FAIL],
+                not_checked_count=row_counts[_NOT_CHECKED],
+                timestamp=timestamp
+            )
+            for space, t, rule_results, status, row_counts in zip(
+                spaces,
+                type_index.tolist(),
+                all_results,
+                overall_index,
+                counts.tolist(),
+            )
+        ]
+    
+    def status_counts_many(
+        self,
+        spaces: Union[List[Dict[str, Any]], SpaceTable],
+        geometry_results: Optional[List[Optional[Dict[str, Any]]]] = None
+    ) -> Dict[RuleStatus, int]:
+        """
+        Count rule outcomes over many spaces without building results.
         
-        # Rule 11: Emergency Exit Width (3:51)
-        rule_results.append(
-            self.check_emergency_exit_width_rule(space_dict)
-        )
+        Uses the same status matrix as check_compliance_many but never
+        formats details or allocates per-space result lists.  Requires numpy.
         
-        # Rule 12: Emergency Exit Door Opens Outward (3:52)
-        rule_results.append(
-            self.check_emergency_exit_door_swing_rule(space_dict)
-        )
+        Args:
+            spaces: Space dictionaries from parser.py, or a SpaceTable
+            geometry_results: Geometry results aligned with spaces (optional)
+            
+        Returns:
+            Number of (space, rule) pairs per RuleStatus
+            
+        Raises:
+            ValueError: If a space is invalid or the lists differ in length
+        """
+        table, geometry_results = self._prepare_many(spaces, geometry_results)
+        codes = self._status_matrix(table, geometry_results)[0]
+        totals = np.bincount(codes.ravel(), minlength=len(_STATUS_ORDER)).tolist()
+        return {status: totals[code] for code, status in enumerate(_STATUS_ORDER)}
+    
+    def validate_compact(
+        self,
+        spaces: Union[List[Dict[str, Any]], SpaceTable],
+        geometry_results: Optional[List[Optional[Dict[str, Any]]]] = None
+    ) -> CompactResults:
+        """
+        Check many spaces, keeping only a status code per (space, rule).
         
-        # Rule 13: Stair Step Dimensions (3:421)
-        rule_results.append(
-            self.check_stair_dimensions_rule(space_dict)
-        )
+        For callers that render or filter a subset of results: statuses are
+        computed as in check_compliance_many, and RuleResults with details
+        are built per cell with CompactResults.materialize.  Requires numpy.
         
-        # Rule 14: Accessible Parking Width (3:131)
-        rule_results.append(
-            self.check_parking_width_rule(space_dict)
+        Args:
+            spaces: Space dictionaries from parser.py, or a SpaceTable
+            geometry_results: Geometry results aligned with spaces (optional)
+            
+        Returns:
+            CompactResults over (spaces, rules)
+            
+        Raises:
+            ValueError: If a space is invalid or the lists differ in length
+        """
+        table, geometry_results = self._prepare_many(spaces, geometry_results)
+        codes, type_names, type_index, scalar_results = self._status_matrix(
+            table, geometry_results
         )
-        
-        # Rule 15: Parking Space Length (3:132)
-        rule_results.append(
-            self.check_parking_length_rule(space_dict)
+        return CompactResults(
+            codes=codes,
+            table=table,
+            geometry_results=geometry_results,
+            type_names=type_names,
+            type_index=type_index,
+            checker=self,
+            scalar_results=scalar_results
         )
+    
+    def _prepare_many(
+        self,
+        spaces: Union[List[Dict[str, Any]], SpaceTable],
+        geometry_results: Optional[List[Optional[Dict[str, Any]]]]
+    ) -> Tuple[SpaceTable, List[Optional[Dict[str, Any]]]]:
+        """Validate batch inputs and return (table, aligned geometry results)."""
+        table = spaces if isinstance(spaces, SpaceTable) else None
+        if table is not None:
+            spaces = table.spaces
+        
+        for space in spaces:
+            self._validate_space_dict(space)
+        if geometry_results is None:
+            geometry_results = [None] * len(spaces)
+        elif len(geometry_results) != len(spaces):
+            raise ValueError(
+                f"Got {len(geometry_results)} geometry results for {len(spaces)} spaces"
+            )
+        if table is None:
+            table = SpaceTable.from_spaces(spaces)
+        return table, geometry_results
+    
+    def _status_matrix(
+        self,
+        table: SpaceTable,
+        geometry_results: List[Optional[Dict[str, Any]]]
+    ) -> Tuple[Any, Any, Any, Dict[Tuple[int, int], RuleResult]]:
+        """
+        Evaluate every (space, rule) pair to an int8 status code.
         
-        # Rule 16: Stair Handrail Both Sides (3:411)
-        rule_results.append(
-            self.check_stair_handrail_both_rule(space_dict)
+        Returns:
+            (codes, type_names, type_index, scalar_results): the
+            (spaces, rules) matrix of _STATUS_ORDER codes; the distinct space
+            types and each space's index into them; and the RuleResults of
+            the rules evaluated per space (those outside the threshold
+            table), keyed by (space, rule) index
+        """
+        n_spaces, n_rules = len(table.spaces), len(self.rules)
+        
+        # One plan per distinct type; applies[i, j] is True when rule j
+        # covers space i
+        type_names, type_index = np.unique(table.types, return_inverse=True)
+        plans = [self._rules_for_type(t) for t in type_names]
+        applies = np.array(
+            [[check is not None for _, check in plan] for plan in plans],
+            dtype=bool
+        ).reshape(len(plans), n_rules)[type_index]
+        
+        # Threshold rules: one (space, field) value matrix checked against
+        # per-field bounds, with the fields of each rule combined
+        values = np.column_stack(
+            [table.columns[name] for name in self._threshold_fields]
+        ) if n_spaces else np.empty((0, len(self._threshold_fields)))
+        rule_columns = np.asarray(self._threshold_rules)
+        threshold_codes = _threshold_kernel(n_spaces)
+        codes = np.full((n_spaces, n_rules), _NOT_APPLICABLE, dtype=np.int8)
+        codes[:, rule_columns] = threshold_codes(
+            values,
+            np.asarray(self._threshold_lo, dtype=np.float64),
+            np.asarray(self._threshold_hi, dtype=np.float64),
+            np.asarray(self._threshold_starts, dtype=np.intp),
+            np.ascontiguousarray(applies[:, rule_columns])
         )
         
-        # Rule 17: Stair Width (3:412)
-        rule_results.append(
-            self.check_stair_width_rule(space_dict)
+        # The remaining rules (geometry/boundary checks) run per space, only
+        # where they apply
+        scalar_results: Dict[Tuple[int, int], RuleResult] = {}
+        threshold_rules = set(self._threshold_rules)
+        for j, (rule, check) in enumerate(self._rule_checks):
+            if j in threshold_rules:
+                continue
+            for i in np.flatnonzero(applies[:, j]).tolist():
+                result = check(
+                    table.spaces[i], geometry_results[i], type_names[type_index[i]]
+                )
+                codes[i, j] = _STATUS_CODES[result.status]
+                scalar_results[i, j] = result
+        
+        return codes, type_names, type_index, scalar_results
+    
+    @staticmethod
+    def _row_status_counts(codes: Any) -> Any:
+        """(spaces, statuses) count matrix from a status-code matrix, via one bincount."""
+        n_spaces = codes.shape[0]
+        n_codes = len(_STATUS_ORDER)
+        offsets = np.arange(n_spaces, dtype=np.intp)[:, None] * n_codes
+        return np.bincount(
+            (offsets + codes).ravel(), minlength=n_spaces * n_codes
+        ).reshape(n_spaces, n_codes)
+    
+    def _overall_status_index(self, codes: Any, counts: Any) -> Any:
+        """
+        Overall status per space (see _calculate_overall_status) as an index
+        into (ERROR, FAIL, PARTIAL, PASS).
+        """
+        critical = np.array(
+            [rule.severity is Severity.CRITICAL for rule in self.rules], dtype=bool
         )
-        
-        # Rule 18: Window Sill Height (3:531)
-        rule_results.append(
-            self.check_window_sill_height_rule(space_dict)
+        warning = np.array(
+            [rule.severity is Severity.WARNING for rule in self.rules], dtype=bool
         )
-        
-        # Rule 19: Window Opening Size (3:532)
-        rule_results.append(
-            self.check_window_opening_size_rule(space_dict)
+        failed_cells = codes == _FAIL
+        return np.select(
+            [
+                counts[:, _ERROR] > 0,
+                (failed_cells & critical).any(axis=1),
+                (counts[:, _NOT_CHECKED] > 0) | (failed_cells & warning).any(axis=1),
+            ],
+            [0, 1, 2],
+            default=3
         )
+    
+    @staticmethod
+    def _fingerprint(
+        space_dict: Dict[str, Any],
+        geometry_result: Optional[Dict[str, Any]]
+    ) -> Optional[Tuple]:
+        """
+        Hashable key capturing every input of a compliance check.
+        
+        The space's id and name only label the result, so they are left out
+        and spaces with identical layouts share one entry.  The boundary is
+        reduced to a digest of its coordinates; other space values are
+        tagged with their type so e.g. 1, 1.0 and True don't collide.  Of the
+        geometry result, only what the turning circle rule reads is kept:
+        whether its space_id matches, passed, the circle center and the
+        collision details.  Returns None when an input can't be hashed, in
+        which case the result isn't cached.
+        """
+        items = []
+        for k, v in space_dict.items():
+            if k == "id" or k == "name":
+                continue
+            if k == "boundary" and isinstance(v, list):
+                v = _boundary_digest(v)
+                if v is None:
+                    return None
+            elif isinstance(v, list):
+                v = tuple(v)
+            items.append((k, type(v), v))
         
-        # Rule 20: Tactile Floor Guidance (3:611)
-        rule_results.append(
-            self.check_tactile_guidance_rule(space_dict)
-        )
+        if geometry_result is None:
+            geometry_key = None
+        else:
+            circle_center = geometry_result.get("circle_center")
+            if isinstance(circle_center, list):
+                circle_center = tuple(circle_center)
+            geometry_key = (
+                geometry_result.get("space_id") == space_dict.get("id"),
+                bool(geometry_result.get("passed", False)),
+                circle_center,
+                geometry_result.get("collision_details", "Circle does not fit"),
+            )
         
-        # Calculate statistics
-        passed = sum(1 for r in rule_results if r.status == RuleStatus.PASS)
-        failed = sum(1 for r in rule_results if r.status == RuleStatus.FAIL)
-        not_checked = sum(1 for r in rule_results 
-                         if r.status == RuleStatus.NOT_CHECKED)
+        key = (geometry_key, tuple(items))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+    
+    def _evaluate(
+        self,
+        space_dict: Dict[str, Any],
+        geometry_result: Optional[Dict[str, Any]],
+        timestamp: str
+    ) -> ComplianceResult:
+        """Run all rules for a validated space (uncached check_compliance)."""
+        space_id = space_dict.get("id", "unknown")
+        space_name = space_dict.get("name", "Unnamed Space")
+        space_type = space_dict.get("type", "unknown").lower()
         
-        # Determine overall status
-        overall_status = self._calculate_overall_status(rule_results)
+        # Run applicable rules and tally them as they come in (see
+        # _calculate_overall_status); the rest are reported as NOT_APPLICABLE,
+        # which never affects counts or overall status
+        rule_results = []
+        passed = failed = not_checked = 0
+        has_error = has_critical_fail = is_partial = False
+        for check, uses_geometry, not_applicable in self._plan_for_type(space_type):
+            if check is None:
+                rule_results.append(not_applicable)
+                continue
+            if uses_geometry:
+                r = check(space_dict, geometry_result, space_type)
+            else:
+                r = check(space_dict, space_type)
+            rule_results.append(r)
+            status = r.status
+            if status is RuleStatus.PASS:
+                passed += 1
+            elif status is RuleStatus.FAIL:
+                failed += 1
+                if r.severity is Severity.CRITICAL:
+                    has_critical_fail = True
+                elif r.severity is Severity.WARNING:
+                    is_partial = True
+            elif status is RuleStatus.NOT_CHECKED:
+                not_checked += 1
+                is_partial = True
+            elif status is RuleStatus.ERROR:
+                has_error = True
+        
+        if has_error:
+            overall_status = OverallStatus.ERROR
+        elif has_critical_fail:
+            overall_status = OverallStatus.FAIL
+        elif is_partial:
+            overall_status = OverallStatus.PARTIAL
+        else:
+            overall_status = OverallStatus.PASS
         
         return ComplianceResult(
             space_id=space_id,
@@ -464,13 +1416,14 @@ class BFS2024ComplianceChecker:
             passed_count=passed,
             failed_count=failed,
             not_checked_count=not_checked,
-            timestamp=datetime.now().isoformat()
+            timestamp=timestamp
         )
     
     def check_turning_circle_rule(
         self, 
         space_dict: Dict[str, Any], 
-        geometry_result: Optional[Dict[str, Any]] = None
+        geometry_result: Optional[Dict[str, Any]] = None,
+        space_type: Optional[str] = None
     ) -> RuleResult:
         """
         Check BFS 2024:1 Section 3:14 - Turning Circle Requirement.
@@ -481,45 +1434,26 @@ class BFS2024ComplianceChecker:
         Args:
             space_dict: Space information
             geometry_result: Result from geometry.py turning circle check
+            space_type: Lower-cased space type, if the caller already has it
             
         Returns:
             RuleResult with compliance status
         """
         rule = self.RULE_TURNING_CIRCLE
-        space_type = space_dict.get("type", "").lower()
+        if space_type is None:
+            space_type = space_dict.get("type", "").lower()
         
         # Check if rule applies to this space type
-        if space_type not in rule["applies_to"]:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.NOT_APPLICABLE,
-                details=f"Rule does not apply to space type: {space_type}",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
+        if space_type not in rule.applies_to:
+            return self._not_applicable_result(rule, space_type)
         
         # Check if geometry result is available
         if geometry_result is None:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.ERROR,
-                details="Geometry check result not provided",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
+            return self._error_result(rule, "Geometry check result not provided")
         
         # Verify geometry result is for correct space
         if geometry_result.get("space_id") != space_dict.get("id"):
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.ERROR,
-                details="Geometry result space_id mismatch",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
+            return self._error_result(rule, "Geometry result space_id mismatch")
         
         # Check geometry result
         passed = geometry_result.get("passed", False)
@@ -530,29 +1464,23 @@ class BFS2024ComplianceChecker:
             if circle_center:
                 center_str = f" at position ({circle_center[0]:.1f}, {circle_center[1]:.1f})mm"
             
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.PASS,
-                details=f"1500mm turning circle fits in space{center_str}",
-                severity=rule["severity"],
-                reference=rule["reference"]
+            return self._result_factories[rule.id](
+                RuleStatus.PASS,
+                f"1500mm turning circle fits in space{center_str}"
             )
         else:
             collision_details = geometry_result.get(
                 "collision_details", 
                 "Circle does not fit"
             )
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.FAIL,
-                details=f"1500mm turning circle does not fit: {collision_details}",
-                severity=rule["severity"],
-                reference=rule["reference"]
+            return self._result_factories[rule.id](
+                RuleStatus.FAIL,
+                f"1500mm turning circle does not fit: {collision_details}"
             )
     
-    def check_door_width_rule(self, space_dict: Dict[str, Any]) -> RuleResult:
+    def check_door_width_rule(
+        self, space_dict: Dict[str, Any], space_type: Optional[str] = None
+    ) -> RuleResult:
         """
         Check BFS 2024:1 Section 3:15 - Door Width Requirement.
         
@@ -563,60 +1491,42 @@ class BFS2024ComplianceChecker:
         
         Args:
             space_dict: Space information
+            space_type: Lower-cased space type, if the caller already has it
             
         Returns:
             RuleResult with compliance status
         """
         rule = self.RULE_DOOR_WIDTH
-        space_type = space_dict.get("type", "").lower()
+        if space_type is None:
+            space_type = space_dict.get("type", "").lower()
         
         # Check if rule applies to this space type
-        if space_type not in rule["applies_to"]:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.NOT_APPLICABLE,
-                details=f"Rule does not apply to space type: {space_type}",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
+        if space_type not in rule.applies_to:
+            return self._not_applicable_result(rule, space_type)
         
         # Get space boundary
         boundary = space_dict.get("boundary")
         if not boundary or len(boundary) < 3:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.ERROR,
-                details="Invalid or missing space boundary",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
+            return self._error_result(rule, "Invalid or missing space boundary")
         
         # Calculate minimum width (simplified check)
         min_width = self._calculate_min_space_width(boundary)
         required_width = 900  # mm
         
         if min_width >= required_width:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.PASS,
-                details=f"Space minimum width {min_width:.0f}mm >= required {required_width}mm (simplified check - actual door width not yet extracted)",
-                severity=rule["severity"],
-                reference=rule["reference"]
+            return self._result_factories[rule.id](
+                RuleStatus.PASS,
+                f"Space minimum width {min_width:.0f}mm >= required {required_width}mm (simplified check - actual door width not yet extracted)"
             )
         else:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.FAIL,
-                details=f"Space minimum width {min_width:.0f}mm < required {required_width}mm (simplified check - may pass with proper door extraction)",
-                severity=rule["severity"],
-                reference=rule["reference"]
+            return self._result_factories[rule.id](
+                RuleStatus.FAIL,
+                f"Space minimum width {min_width:.0f}mm < required {required_width}mm (simplified check - may pass with proper door extraction)"
             )
     
-    def check_threshold_rule(self, space_dict: Dict[str, Any]) -> RuleResult:
+    def check_threshold_rule(
+        self, space_dict: Dict[str, Any], space_type: Optional[str] = None
+    ) -> RuleResult:
         """
         Check BFS 2024:1 Section 3:16 - Threshold Height Requirement.
         
@@ -628,36 +1538,26 @@ class BFS2024ComplianceChecker:
         
         Args:
             space_dict: Space information
+            space_type: Lower-cased space type, if the caller already has it
             
         Returns:
             RuleResult with NOT_CHECKED status
         """
         rule = self.RULE_THRESHOLD
-        space_type = space_dict.get("type", "").lower()
+        if space_type is None:
+            space_type = space_dict.get("type", "").lower()
         
         # Check if rule applies to this space type
-        if space_type not in rule["applies_to"]:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.NOT_APPLICABLE,
-                details=f"Rule does not apply to space type: {space_type}",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
+        if space_type not in rule.applies_to:
+            return self._not_applicable_result(rule, space_type)
         
         # Placeholder - threshold data not yet available
-        return RuleResult(
-            rule_id=rule["id"],
-            rule_name=rule["name"],
-            status=RuleStatus.NOT_CHECKED,
-            details="Threshold data not available in current IFC file. Will be checked when door/threshold extraction is implemented.",
-            severity=rule["severity"],
-            reference=rule["reference"]
-        )
+        return self._not_checked_result(rule, "Threshold data not available in current IFC file. Will be checked when door/threshold extraction is implemented.")
     
-    def check_corridor_width_rule(self, space_dict: Dict[str, Any]) -> RuleResult:
-        """
+    check_corridor_width_rule = _single_threshold_check(
+        "RULE_CORRIDOR_WIDTH", "corridor_width_mm", "Corridor width", ">=", 1300,
+        missing_details="Corridor width not available in current IFC file. Will be checked when corridor geometry extraction is implemented.",
+        doc="""
         Check BFS 2024:1 Section 3:22 - Corridor Width Requirement.
         
         Requirement: Minimum 1300mm clear width for corridors.
@@ -666,51 +1566,11 @@ class BFS2024ComplianceChecker:
         
         Returns NOT_CHECKED if corridor width data is not in space_dict.
         """
-        rule = self.RULE_CORRIDOR_WIDTH
-        space_type = space_dict.get("type", "").lower()
-        
-        if space_type not in rule["applies_to"]:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.NOT_APPLICABLE,
-                details=f"Rule does not apply to space type: {space_type}",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
-        
-        # Check for corridor width (from future IFC extraction)
-        corridor_width_mm = space_dict.get("corridor_width_mm")
-        if corridor_width_mm is None:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.NOT_CHECKED,
-                details="Corridor width not available in current IFC file. Will be checked when corridor geometry extraction is implemented.",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
-        
-        required_width = 1300  # mm
-        if corridor_width_mm >= required_width:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.PASS,
-                details=f"Corridor width {corridor_width_mm:.0f}mm >= required {required_width}mm. {rule.get('description_en', '')}",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
-        return RuleResult(
-            rule_id=rule["id"],
-            rule_name=rule["name"],
-            status=RuleStatus.FAIL,
-            details=f"Corridor width {corridor_width_mm:.0f}mm < required {required_width}mm. {rule.get('description_en', '')}",
-            severity=rule["severity"],
-            reference=rule["reference"]
-        )
+    )
     
-    def check_ramp_slope_rule(self, space_dict: Dict[str, Any]) -> RuleResult:
+    def check_ramp_slope_rule(
+        self, space_dict: Dict[str, Any], space_type: Optional[str] = None
+    ) -> RuleResult:
         """
         Check BFS 2024:1 Section 3:231 - Ramp Slope Requirement.
         
@@ -721,52 +1581,33 @@ class BFS2024ComplianceChecker:
         Returns NOT_CHECKED if ramp slope data is not in space_dict.
         """
         rule = self.RULE_RAMP_SLOPE
-        space_type = space_dict.get("type", "").lower()
+        if space_type is None:
+            space_type = space_dict.get("type", "").lower()
         
-        if space_type not in rule["applies_to"]:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.NOT_APPLICABLE,
-                details=f"Rule does not apply to space type: {space_type}",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
+        if space_type not in rule.applies_to:
+            return self._not_applicable_result(rule, space_type)
         
         # Slope as ratio (e.g. 0.0833 = 8.33%) or as rise:run from IFC
         slope_ratio = space_dict.get("ramp_slope_ratio")  # e.g. 0.0833
         if slope_ratio is None:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.NOT_CHECKED,
-                details="Ramp slope not available in current IFC file. Will be checked when ramp geometry extraction is implemented.",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
+            return self._not_checked_result(rule, "Ramp slope not available in current IFC file. Will be checked when ramp geometry extraction is implemented.")
         
         max_slope = 1 / 12  # 8.33%
         if slope_ratio <= max_slope:
             pct = slope_ratio * 100
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.PASS,
-                details=f"Ramp slope {pct:.2f}% (1:{1/slope_ratio:.1f}) <= max 8.33% (1:12). {rule.get('description_en', '')}",
-                severity=rule["severity"],
-                reference=rule["reference"]
+            return self._result_factories[rule.id](
+                RuleStatus.PASS,
+                f"Ramp slope {pct:.2f}% (1:{1/slope_ratio:.1f}) <= max 8.33% (1:12). {rule.description_en}"
             )
         pct = slope_ratio * 100
-        return RuleResult(
-            rule_id=rule["id"],
-            rule_name=rule["name"],
-            status=RuleStatus.FAIL,
-            details=f"Ramp slope {pct:.2f}% exceeds max 8.33% (1:12). {rule.get('description_en', '')}",
-            severity=rule["severity"],
-            reference=rule["reference"]
+        return self._result_factories[rule.id](
+            RuleStatus.FAIL,
+            f"Ramp slope {pct:.2f}% exceeds max 8.33% (1:12). {rule.description_en}"
         )
     
-    def check_handrail_height_rule(self, space_dict: Dict[str, Any]) -> RuleResult:
+    def check_handrail_height_rule(
+        self, space_dict: Dict[str, Any], space_type: Optional[str] = None
+    ) -> RuleResult:
         """
         Check BFS 2024:1 Section 3:232 - Handrail Height Requirement.
         
@@ -777,49 +1618,30 @@ class BFS2024ComplianceChecker:
         Returns NOT_CHECKED if handrail height data is not in space_dict.
         """
         rule = self.RULE_HANDRAIL_HEIGHT
-        space_type = space_dict.get("type", "").lower()
+        if space_type is None:
+            space_type = space_dict.get("type", "").lower()
         
-        if space_type not in rule["applies_to"]:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.NOT_APPLICABLE,
-                details=f"Rule does not apply to space type: {space_type}",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
+        if space_type not in rule.applies_to:
+            return self._not_applicable_result(rule, space_type)
         
         handrail_height_mm = space_dict.get("handrail_height_mm")
         if handrail_height_mm is None:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.NOT_CHECKED,
-                details="Handrail height not available in current IFC file. Will be checked when railing extraction is implemented.",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
+            return self._not_checked_result(rule, "Handrail height not available in current IFC file. Will be checked when railing extraction is implemented.")
         
         min_h, max_h = 900, 1000
         if min_h <= handrail_height_mm <= max_h:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.PASS,
-                details=f"Handrail height {handrail_height_mm:.0f}mm within 900–1000mm. {rule.get('description_en', '')}",
-                severity=rule["severity"],
-                reference=rule["reference"]
+            return self._result_factories[rule.id](
+                RuleStatus.PASS,
+                f"Handrail height {handrail_height_mm:.0f}mm within 900–1000mm. {rule.description_en}"
             )
-        return RuleResult(
-            rule_id=rule["id"],
-            rule_name=rule["name"],
-            status=RuleStatus.FAIL,
-            details=f"Handrail height {handrail_height_mm:.0f}mm outside 900–1000mm. {rule.get('description_en', '')}",
-            severity=rule["severity"],
-            reference=rule["reference"]
+        return self._result_factories[rule.id](
+            RuleStatus.FAIL,
+            f"Handrail height {handrail_height_mm:.0f}mm outside 900–1000mm. {rule.description_en}"
         )
     
-    def check_bathroom_door_swing_rule(self, space_dict: Dict[str, Any]) -> RuleResult:
+    def check_bathroom_door_swing_rule(
+        self, space_dict: Dict[str, Any], space_type: Optional[str] = None
+    ) -> RuleResult:
         """
         Check BFS 2024:1 Section 3:241 - Bathroom Door Opens Outward.
         
@@ -830,49 +1652,30 @@ class BFS2024ComplianceChecker:
         Returns NOT_CHECKED if door swing data is not in space_dict.
         """
         rule = self.RULE_BATHROOM_DOOR_SWING
-        space_type = space_dict.get("type", "").lower()
+        if space_type is None:
+            space_type = space_dict.get("type", "").lower()
         
-        if space_type not in rule["applies_to"]:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.NOT_APPLICABLE,
-                details=f"Rule does not apply to space type: {space_type}",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
+        if space_type not in rule.applies_to:
+            return self._not_applicable_result(rule, space_type)
         
         # Expects space_dict.get("door_opens_outward") == True/False when implemented
         door_opens_outward = space_dict.get("door_opens_outward")
         if door_opens_outward is None:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.NOT_CHECKED,
-                details="Door swing direction not available in current IFC file. Will be checked when door extraction is implemented.",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
+            return self._not_checked_result(rule, "Door swing direction not available in current IFC file. Will be checked when door extraction is implemented.")
         
         if door_opens_outward:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.PASS,
-                details=f"Bathroom door opens outward. {rule.get('description_en', '')}",
-                severity=rule["severity"],
-                reference=rule["reference"]
+            return self._result_factories[rule.id](
+                RuleStatus.PASS,
+                f"Bathroom door opens outward. {rule.description_en}"
             )
-        return RuleResult(
-            rule_id=rule["id"],
-            rule_name=rule["name"],
-            status=RuleStatus.FAIL,
-            details="Bathroom door does not open outward; must open outward for emergency access.",
-            severity=rule["severity"],
-            reference=rule["reference"]
+        return self._result_factories[rule.id](
+            RuleStatus.FAIL,
+            "Bathroom door does not open outward; must open outward for emergency access."
         )
     
-    def check_rest_area_25m_rule(self, space_dict: Dict[str, Any]) -> RuleResult:
+    def check_rest_area_25m_rule(
+        self, space_dict: Dict[str, Any], space_type: Optional[str] = None
+    ) -> RuleResult:
         """
         Check BFS 2024:1 Section 3:311 - Rest Area Every 25m in Corridors.
         
@@ -883,49 +1686,30 @@ class BFS2024ComplianceChecker:
         Returns NOT_CHECKED if corridor length/rest-area data is not in space_dict.
         """
         rule = self.RULE_REST_AREA_25M
-        space_type = space_dict.get("type", "").lower()
+        if space_type is None:
+            space_type = space_dict.get("type", "").lower()
         
-        if space_type not in rule["applies_to"]:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.NOT_APPLICABLE,
-                details=f"Rule does not apply to space type: {space_type}",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
+        if space_type not in rule.applies_to:
+            return self._not_applicable_result(rule, space_type)
         
         # Expects e.g. corridor_length_m, rest_area_interval_m or rest_areas_present
         has_rest_areas_ok = space_dict.get("rest_area_25m_compliant")
         if has_rest_areas_ok is None:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.NOT_CHECKED,
-                details="Corridor length and rest area data not available in current IFC file. Will be checked when corridor/rest-area extraction is implemented.",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
+            return self._not_checked_result(rule, "Corridor length and rest area data not available in current IFC file. Will be checked when corridor/rest-area extraction is implemented.")
         
         if has_rest_areas_ok:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.PASS,
-                details=f"Rest area or widening provided at least every 25m. {rule.get('description_en', '')}",
-                severity=rule["severity"],
-                reference=rule["reference"]
+            return self._result_factories[rule.id](
+                RuleStatus.PASS,
+                f"Rest area or widening provided at least every 25m. {rule.description_en}"
             )
-        return RuleResult(
-            rule_id=rule["id"],
-            rule_name=rule["name"],
-            status=RuleStatus.FAIL,
-            details="Rest area or widening required at least every 25m in corridor.",
-            severity=rule["severity"],
-            reference=rule["reference"]
+        return self._result_factories[rule.id](
+            RuleStatus.FAIL,
+            "Rest area or widening required at least every 25m in corridor."
         )
     
-    def check_elevator_size_rule(self, space_dict: Dict[str, Any]) -> RuleResult:
+    def check_elevator_size_rule(
+        self, space_dict: Dict[str, Any], space_type: Optional[str] = None
+    ) -> RuleResult:
         """
         Check BFS 2024:1 Section 3:143 - Elevator Minimum Size.
         
@@ -936,56 +1720,39 @@ class BFS2024ComplianceChecker:
         Returns NOT_CHECKED if elevator dimensions are not in space_dict.
         """
         rule = self.RULE_ELEVATOR_SIZE
-        space_type = space_dict.get("type", "").lower()
+        if space_type is None:
+            space_type = space_dict.get("type", "").lower()
         
-        if space_type not in rule["applies_to"]:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.NOT_APPLICABLE,
-                details=f"Rule does not apply to space type: {space_type}",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
+        if space_type not in rule.applies_to:
+            return self._not_applicable_result(rule, space_type)
         
         width_mm = space_dict.get("elevator_width_mm")
         depth_mm = space_dict.get("elevator_depth_mm")
         if width_mm is None or depth_mm is None:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.NOT_CHECKED,
-                details="Elevator cabin dimensions not available in current IFC file. Will be checked when elevator geometry extraction is implemented.",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
+            return self._not_checked_result(rule, "Elevator cabin dimensions not available in current IFC file. Will be checked when elevator geometry extraction is implemented.")
         
         min_width, min_depth = 1100, 1400
         if width_mm >= min_width and depth_mm >= min_depth:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.PASS,
-                details=f"Elevator size {width_mm:.0f}mm x {depth_mm:.0f}mm >= required {min_width}mm x {min_depth}mm. {rule.get('description_en', '')}",
-                severity=rule["severity"],
-                reference=rule["reference"]
+            return self._result_factories[rule.id](
+                RuleStatus.PASS,
+                f"Elevator size {width_mm:.0f}mm x {depth_mm:.0f}mm >= required {min_width}mm x {min_depth}mm. {rule.description_en}"
             )
-        issues = []
-        if width_mm < min_width:
-            issues.append(f"width {width_mm:.0f}mm < {min_width}mm")
-        if depth_mm < min_depth:
-            issues.append(f"depth {depth_mm:.0f}mm < {min_depth}mm")
-        return RuleResult(
-            rule_id=rule["id"],
-            rule_name=rule["name"],
-            status=RuleStatus.FAIL,
-            details=f"Elevator size insufficient: {'; '.join(issues)}. {rule.get('description_en', '')}",
-            severity=rule["severity"],
-            reference=rule["reference"]
+        width_bad = width_mm < min_width
+        depth_bad = depth_mm < min_depth
+        issues = (
+            (f"width {width_mm:.0f}mm < {min_width}mm" if width_bad else "")
+            + ("; " if width_bad and depth_bad else "")
+            + (f"depth {depth_mm:.0f}mm < {min_depth}mm" if depth_bad else "")
+        )
+        return self._result_factories[rule.id](
+            RuleStatus.FAIL,
+            f"Elevator size insufficient: {issues}. {rule.description_en}"
         )
     
-    def check_elevator_door_width_rule(self, space_dict: Dict[str, Any]) -> RuleResult:
-        """
+    check_elevator_door_width_rule = _single_threshold_check(
+        "RULE_ELEVATOR_DOOR_WIDTH", "elevator_door_width_mm", "Elevator door width", ">=", 800,
+        missing_details="Elevator door width not available in current IFC file. Will be checked when elevator door extraction is implemented.",
+        doc="""
         Check BFS 2024:1 Section 3:144 - Elevator Door Width.
         
         Requirement: Elevator door clear width minimum 800mm.
@@ -994,51 +1761,12 @@ class BFS2024ComplianceChecker:
         
         Returns NOT_CHECKED if elevator door width is not in space_dict.
         """
-        rule = self.RULE_ELEVATOR_DOOR_WIDTH
-        space_type = space_dict.get("type", "").lower()
-        
-        if space_type not in rule["applies_to"]:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.NOT_APPLICABLE,
-                details=f"Rule does not apply to space type: {space_type}",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
-        
-        door_width_mm = space_dict.get("elevator_door_width_mm")
-        if door_width_mm is None:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.NOT_CHECKED,
-                details="Elevator door width not available in current IFC file. Will be checked when elevator door extraction is implemented.",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
-        
-        required = 800
-        if door_width_mm >= required:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.PASS,
-                details=f"Elevator door width {door_width_mm:.0f}mm >= required {required}mm. {rule.get('description_en', '')}",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
-        return RuleResult(
-            rule_id=rule["id"],
-            rule_name=rule["name"],
-            status=RuleStatus.FAIL,
-            details=f"Elevator door width {door_width_mm:.0f}mm < required {required}mm. {rule.get('description_en', '')}",
-            severity=rule["severity"],
-            reference=rule["reference"]
-        )
+    )
     
-    def check_emergency_exit_width_rule(self, space_dict: Dict[str, Any]) -> RuleResult:
-        """
+    check_emergency_exit_width_rule = _single_threshold_check(
+        "RULE_EMERGENCY_EXIT_WIDTH", "emergency_exit_width_mm", "Emergency exit width", ">=", 900,
+        missing_details="Emergency exit width not available in current IFC file. Will be checked when exit geometry extraction is implemented.",
+        doc="""
         Check BFS 2024:1 Section 3:51 - Emergency Exit Width.
         
         Requirement: Emergency exit clear width minimum 900mm.
@@ -1047,50 +1775,11 @@ class BFS2024ComplianceChecker:
         
         Returns NOT_CHECKED if emergency exit width is not in space_dict.
         """
-        rule = self.RULE_EMERGENCY_EXIT_WIDTH
-        space_type = space_dict.get("type", "").lower()
-        
-        if space_type not in rule["applies_to"]:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.NOT_APPLICABLE,
-                details=f"Rule does not apply to space type: {space_type}",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
-        
-        width_mm = space_dict.get("emergency_exit_width_mm")
-        if width_mm is None:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.NOT_CHECKED,
-                details="Emergency exit width not available in current IFC file. Will be checked when exit geometry extraction is implemented.",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
-        
-        required = 900
-        if width_mm >= required:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.PASS,
-                details=f"Emergency exit width {width_mm:.0f}mm >= required {required}mm. {rule.get('description_en', '')}",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
-        return RuleResult(
-            rule_id=rule["id"],
-            rule_name=rule["name"],
-            status=RuleStatus.FAIL,
-            details=f"Emergency exit width {width_mm:.0f}mm < required {required}mm. {rule.get('description_en', '')}",
-            severity=rule["severity"],
-            reference=rule["reference"]
-        )
+    )
     
-    def check_emergency_exit_door_swing_rule(self, space_dict: Dict[str, Any]) -> RuleResult:
+    def check_emergency_exit_door_swing_rule(
+        self, space_dict: Dict[str, Any], space_type: Optional[str] = None
+    ) -> RuleResult:
         """
         Check BFS 2024:1 Section 3:52 - Emergency Exit Door Opens Outward.
         
@@ -1101,48 +1790,29 @@ class BFS2024ComplianceChecker:
         Returns NOT_CHECKED if door swing data is not in space_dict.
         """
         rule = self.RULE_EMERGENCY_EXIT_DOOR_SWING
-        space_type = space_dict.get("type", "").lower()
+        if space_type is None:
+            space_type = space_dict.get("type", "").lower()
         
-        if space_type not in rule["applies_to"]:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.NOT_APPLICABLE,
-                details=f"Rule does not apply to space type: {space_type}",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
+        if space_type not in rule.applies_to:
+            return self._not_applicable_result(rule, space_type)
         
         opens_outward = space_dict.get("emergency_exit_door_opens_outward")
         if opens_outward is None:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.NOT_CHECKED,
-                details="Emergency exit door swing direction not available in current IFC file. Will be checked when exit door extraction is implemented.",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
+            return self._not_checked_result(rule, "Emergency exit door swing direction not available in current IFC file. Will be checked when exit door extraction is implemented.")
         
         if opens_outward:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.PASS,
-                details=f"Emergency exit door opens outward. {rule.get('description_en', '')}",
-                severity=rule["severity"],
-                reference=rule["reference"]
+            return self._result_factories[rule.id](
+                RuleStatus.PASS,
+                f"Emergency exit door opens outward. {rule.description_en}"
             )
-        return RuleResult(
-            rule_id=rule["id"],
-            rule_name=rule["name"],
-            status=RuleStatus.FAIL,
-            details="Emergency exit door does not open outward; must open outward for evacuation.",
-            severity=rule["severity"],
-            reference=rule["reference"]
+        return self._result_factories[rule.id](
+            RuleStatus.FAIL,
+            "Emergency exit door does not open outward; must open outward for evacuation."
         )
     
-    def check_stair_dimensions_rule(self, space_dict: Dict[str, Any]) -> RuleResult:
+    def check_stair_dimensions_rule(
+        self, space_dict: Dict[str, Any], space_type: Optional[str] = None
+    ) -> RuleResult:
         """
         Check BFS 2024:1 Section 3:421 - Stair Step Height and Depth.
         
@@ -1153,56 +1823,39 @@ class BFS2024ComplianceChecker:
         Returns NOT_CHECKED if stair dimension data is not in space_dict.
         """
         rule = self.RULE_STAIR_DIMENSIONS
-        space_type = space_dict.get("type", "").lower()
+        if space_type is None:
+            space_type = space_dict.get("type", "").lower()
         
-        if space_type not in rule["applies_to"]:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.NOT_APPLICABLE,
-                details=f"Rule does not apply to space type: {space_type}",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
+        if space_type not in rule.applies_to:
+            return self._not_applicable_result(rule, space_type)
         
         rise_mm = space_dict.get("stair_rise_mm")
         run_mm = space_dict.get("stair_run_mm")
         if rise_mm is None or run_mm is None:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.NOT_CHECKED,
-                details="Stair step dimensions (rise/run) not available in current IFC file. Will be checked when stair geometry extraction is implemented.",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
+            return self._not_checked_result(rule, "Stair step dimensions (rise/run) not available in current IFC file. Will be checked when stair geometry extraction is implemented.")
         
         max_rise, min_run = 150, 300
         if rise_mm <= max_rise and run_mm >= min_run:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.PASS,
-                details=f"Step rise {rise_mm:.0f}mm <= {max_rise}mm, run {run_mm:.0f}mm >= {min_run}mm. {rule.get('description_en', '')}",
-                severity=rule["severity"],
-                reference=rule["reference"]
+            return self._result_factories[rule.id](
+                RuleStatus.PASS,
+                f"Step rise {rise_mm:.0f}mm <= {max_rise}mm, run {run_mm:.0f}mm >= {min_run}mm. {rule.description_en}"
             )
-        issues = []
-        if rise_mm > max_rise:
-            issues.append(f"rise {rise_mm:.0f}mm > max {max_rise}mm")
-        if run_mm < min_run:
-            issues.append(f"run {run_mm:.0f}mm < min {min_run}mm")
-        return RuleResult(
-            rule_id=rule["id"],
-            rule_name=rule["name"],
-            status=RuleStatus.FAIL,
-            details=f"Stair dimensions non-compliant: {'; '.join(issues)}. {rule.get('description_en', '')}",
-            severity=rule["severity"],
-            reference=rule["reference"]
+        rise_bad = rise_mm > max_rise
+        run_bad = run_mm < min_run
+        issues = (
+            (f"rise {rise_mm:.0f}mm > max {max_rise}mm" if rise_bad else "")
+            + ("; " if rise_bad and run_bad else "")
+            + (f"run {run_mm:.0f}mm < min {min_run}mm" if run_bad else "")
+        )
+        return self._result_factories[rule.id](
+            RuleStatus.FAIL,
+            f"Stair dimensions non-compliant: {issues}. {rule.description_en}"
         )
     
-    def check_parking_width_rule(self, space_dict: Dict[str, Any]) -> RuleResult:
-        """
+    check_parking_width_rule = _single_threshold_check(
+        "RULE_PARKING_WIDTH", "parking_width_mm", "Parking width", ">=", 3600,
+        missing_details="Parking space width not available in current IFC file. Will be checked when parking geometry extraction is implemented.",
+        doc="""
         Check BFS 2024:1 Section 3:131 - Accessible Parking Space Width.
         
         Requirement: Accessible parking space minimum 3600mm wide.
@@ -1211,51 +1864,12 @@ class BFS2024ComplianceChecker:
         
         Returns NOT_CHECKED if parking width is not in space_dict.
         """
-        rule = self.RULE_PARKING_WIDTH
-        space_type = space_dict.get("type", "").lower()
-        
-        if space_type not in rule["applies_to"]:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.NOT_APPLICABLE,
-                details=f"Rule does not apply to space type: {space_type}",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
-        
-        width_mm = space_dict.get("parking_width_mm")
-        if width_mm is None:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.NOT_CHECKED,
-                details="Parking space width not available in current IFC file. Will be checked when parking geometry extraction is implemented.",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
-        
-        required = 3600
-        if width_mm >= required:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.PASS,
-                details=f"Parking width {width_mm:.0f}mm >= required {required}mm. {rule.get('description_en', '')}",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
-        return RuleResult(
-            rule_id=rule["id"],
-            rule_name=rule["name"],
-            status=RuleStatus.FAIL,
-            details=f"Parking width {width_mm:.0f}mm < required {required}mm. {rule.get('description_en', '')}",
-            severity=rule["severity"],
-            reference=rule["reference"]
-        )
+    )
     
-    def check_parking_length_rule(self, space_dict: Dict[str, Any]) -> RuleResult:
-        """
+    check_parking_length_rule = _single_threshold_check(
+        "RULE_PARKING_LENGTH", "parking_length_mm", "Parking length", ">=", 5000,
+        missing_details="Parking space length not available in current IFC file. Will be checked when parking geometry extraction is implemented.",
+        doc="""
         Check BFS 2024:1 Section 3:132 - Parking Space Length.
         
         Requirement: Parking space length minimum 5000mm.
@@ -1264,50 +1878,11 @@ class BFS2024ComplianceChecker:
         
         Returns NOT_CHECKED if parking length is not in space_dict.
         """
-        rule = self.RULE_PARKING_LENGTH
-        space_type = space_dict.get("type", "").lower()
-        
-        if space_type not in rule["applies_to"]:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.NOT_APPLICABLE,
-                details=f"Rule does not apply to space type: {space_type}",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
-        
-        length_mm = space_dict.get("parking_length_mm")
-        if length_mm is None:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.NOT_CHECKED,
-                details="Parking space length not available in current IFC file. Will be checked when parking geometry extraction is implemented.",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
-        
-        required = 5000
-        if length_mm >= required:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.PASS,
-                details=f"Parking length {length_mm:.0f}mm >= required {required}mm. {rule.get('description_en', '')}",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
-        return RuleResult(
-            rule_id=rule["id"],
-            rule_name=rule["name"],
-            status=RuleStatus.FAIL,
-            details=f"Parking length {length_mm:.0f}mm < required {required}mm. {rule.get('description_en', '')}",
-            severity=rule["severity"],
-            reference=rule["reference"]
-        )
+    )
     
-    def check_stair_handrail_both_rule(self, space_dict: Dict[str, Any]) -> RuleResult:
+    def check_stair_handrail_both_rule(
+        self, space_dict: Dict[str, Any], space_type: Optional[str] = None
+    ) -> RuleResult:
         """
         Check BFS 2024:1 Section 3:411 - Stair Handrail Both Sides.
         
@@ -1318,49 +1893,30 @@ class BFS2024ComplianceChecker:
         Returns NOT_CHECKED if handrail data is not in space_dict.
         """
         rule = self.RULE_STAIR_HANDRAIL_BOTH
-        space_type = space_dict.get("type", "").lower()
+        if space_type is None:
+            space_type = space_dict.get("type", "").lower()
         
-        if space_type not in rule["applies_to"]:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.NOT_APPLICABLE,
-                details=f"Rule does not apply to space type: {space_type}",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
+        if space_type not in rule.applies_to:
+            return self._not_applicable_result(rule, space_type)
         
         both_sides = space_dict.get("stair_handrail_both_sides")
         if both_sides is None:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.NOT_CHECKED,
-                details="Stair handrail configuration not available in current IFC file. Will be checked when railing extraction is implemented.",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
+            return self._not_checked_result(rule, "Stair handrail configuration not available in current IFC file. Will be checked when railing extraction is implemented.")
         
         if both_sides:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.PASS,
-                details=f"Stair has handrails on both sides. {rule.get('description_en', '')}",
-                severity=rule["severity"],
-                reference=rule["reference"]
+            return self._result_factories[rule.id](
+                RuleStatus.PASS,
+                f"Stair has handrails on both sides. {rule.description_en}"
             )
-        return RuleResult(
-            rule_id=rule["id"],
-            rule_name=rule["name"],
-            status=RuleStatus.FAIL,
-            details="Stair must have handrails on both sides.",
-            severity=rule["severity"],
-            reference=rule["reference"]
+        return self._result_factories[rule.id](
+            RuleStatus.FAIL,
+            "Stair must have handrails on both sides."
         )
     
-    def check_stair_width_rule(self, space_dict: Dict[str, Any]) -> RuleResult:
-        """
+    check_stair_width_rule = _single_threshold_check(
+        "RULE_STAIR_WIDTH", "stair_width_mm", "Stair width", ">=", 1200,
+        missing_details="Stair width not available in current IFC file. Will be checked when stair geometry extraction is implemented.",
+        doc="""
         Check BFS 2024:1 Section 3:412 - Stair Width.
         
         Requirement: Stair clear width minimum 1200mm.
@@ -1369,51 +1925,12 @@ class BFS2024ComplianceChecker:
         
         Returns NOT_CHECKED if stair width is not in space_dict.
         """
-        rule = self.RULE_STAIR_WIDTH
-        space_type = space_dict.get("type", "").lower()
-        
-        if space_type not in rule["applies_to"]:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.NOT_APPLICABLE,
-                details=f"Rule does not apply to space type: {space_type}",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
-        
-        width_mm = space_dict.get("stair_width_mm")
-        if width_mm is None:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.NOT_CHECKED,
-                details="Stair width not available in current IFC file. Will be checked when stair geometry extraction is implemented.",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
-        
-        required = 1200
-        if width_mm >= required:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.PASS,
-                details=f"Stair width {width_mm:.0f}mm >= required {required}mm. {rule.get('description_en', '')}",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
-        return RuleResult(
-            rule_id=rule["id"],
-            rule_name=rule["name"],
-            status=RuleStatus.FAIL,
-            details=f"Stair width {width_mm:.0f}mm < required {required}mm. {rule.get('description_en', '')}",
-            severity=rule["severity"],
-            reference=rule["reference"]
-        )
+    )
     
-    def check_window_sill_height_rule(self, space_dict: Dict[str, Any]) -> RuleResult:
-        """
+    check_window_sill_height_rule = _single_threshold_check(
+        "RULE_WINDOW_SILL_HEIGHT", "window_sill_height_mm", "Window sill height", "<=", 600,
+        missing_details="Window sill height not available in current IFC file. Will be checked when window extraction is implemented.",
+        doc="""
         Check BFS 2024:1 Section 3:531 - Window Sill Height.
         
         Requirement: Window sill height maximum 600mm from floor.
@@ -1422,50 +1939,11 @@ class BFS2024ComplianceChecker:
         
         Returns NOT_CHECKED if window sill height is not in space_dict.
         """
-        rule = self.RULE_WINDOW_SILL_HEIGHT
-        space_type = space_dict.get("type", "").lower()
-        
-        if space_type not in rule["applies_to"]:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.NOT_APPLICABLE,
-                details=f"Rule does not apply to space type: {space_type}",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
-        
-        sill_height_mm = space_dict.get("window_sill_height_mm")
-        if sill_height_mm is None:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.NOT_CHECKED,
-                details="Window sill height not available in current IFC file. Will be checked when window extraction is implemented.",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
-        
-        max_height = 600
-        if sill_height_mm <= max_height:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.PASS,
-                details=f"Window sill height {sill_height_mm:.0f}mm <= max {max_height}mm. {rule.get('description_en', '')}",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
-        return RuleResult(
-            rule_id=rule["id"],
-            rule_name=rule["name"],
-            status=RuleStatus.FAIL,
-            details=f"Window sill height {sill_height_mm:.0f}mm > max {max_height}mm. {rule.get('description_en', '')}",
-            severity=rule["severity"],
-            reference=rule["reference"]
-        )
+    )
     
-    def check_window_opening_size_rule(self, space_dict: Dict[str, Any]) -> RuleResult:
+    def check_window_opening_size_rule(
+        self, space_dict: Dict[str, Any], space_type: Optional[str] = None
+    ) -> RuleResult:
         """
         Check BFS 2024:1 Section 3:532 - Window Opening Size.
         
@@ -1476,55 +1954,38 @@ class BFS2024ComplianceChecker:
         Returns NOT_CHECKED if window opening dimensions are not in space_dict.
         """
         rule = self.RULE_WINDOW_OPENING_SIZE
-        space_type = space_dict.get("type", "").lower()
+        if space_type is None:
+            space_type = space_dict.get("type", "").lower()
         
-        if space_type not in rule["applies_to"]:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.NOT_APPLICABLE,
-                details=f"Rule does not apply to space type: {space_type}",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
+        if space_type not in rule.applies_to:
+            return self._not_applicable_result(rule, space_type)
         
         width_mm = space_dict.get("window_opening_width_mm")
         height_mm = space_dict.get("window_opening_height_mm")
         if width_mm is None or height_mm is None:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.NOT_CHECKED,
-                details="Window opening dimensions not available in current IFC file. Will be checked when window extraction is implemented.",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
+            return self._not_checked_result(rule, "Window opening dimensions not available in current IFC file. Will be checked when window extraction is implemented.")
         
         min_width, min_height = 900, 1200
         if width_mm >= min_width and height_mm >= min_height:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.PASS,
-                details=f"Window opening {width_mm:.0f}mm x {height_mm:.0f}mm >= required {min_width}mm x {min_height}mm. {rule.get('description_en', '')}",
-                severity=rule["severity"],
-                reference=rule["reference"]
+            return self._result_factories[rule.id](
+                RuleStatus.PASS,
+                f"Window opening {width_mm:.0f}mm x {height_mm:.0f}mm >= required {min_width}mm x {min_height}mm. {rule.description_en}"
             )
-        issues = []
-        if width_mm < min_width:
-            issues.append(f"width {width_mm:.0f}mm < {min_width}mm")
-        if height_mm < min_height:
-            issues.append(f"height {height_mm:.0f}mm < {min_height}mm")
-        return RuleResult(
-            rule_id=rule["id"],
-            rule_name=rule["name"],
-            status=RuleStatus.FAIL,
-            details=f"Window opening insufficient: {'; '.join(issues)}. {rule.get('description_en', '')}",
-            severity=rule["severity"],
-            reference=rule["reference"]
+        width_bad = width_mm < min_width
+        height_bad = height_mm < min_height
+        issues = (
+            (f"width {width_mm:.0f}mm < {min_width}mm" if width_bad else "")
+            + ("; " if width_bad and height_bad else "")
+            + (f"height {height_mm:.0f}mm < {min_height}mm" if height_bad else "")
+        )
+        return self._result_factories[rule.id](
+            RuleStatus.FAIL,
+            f"Window opening insufficient: {issues}. {rule.description_en}"
         )
     
-    def check_tactile_guidance_rule(self, space_dict: Dict[str, Any]) -> RuleResult:
+    def check_tactile_guidance_rule(
+        self, space_dict: Dict[str, Any], space_type: Optional[str] = None
+    ) -> RuleResult:
         """
         Check BFS 2024:1 Section 3:611 - Tactile Floor Guidance.
         
@@ -1535,45 +1996,24 @@ class BFS2024ComplianceChecker:
         Returns NOT_CHECKED if tactile guidance data is not in space_dict.
         """
         rule = self.RULE_TACTILE_GUIDANCE
-        space_type = space_dict.get("type", "").lower()
+        if space_type is None:
+            space_type = space_dict.get("type", "").lower()
         
-        if space_type not in rule["applies_to"]:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.NOT_APPLICABLE,
-                details=f"Rule does not apply to space type: {space_type}",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
+        if space_type not in rule.applies_to:
+            return self._not_applicable_result(rule, space_type)
         
         has_guidance = space_dict.get("tactile_guidance_present")
         if has_guidance is None:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.NOT_CHECKED,
-                details="Tactile floor guidance data not available in current IFC file. Will be checked when floor finish/guidance extraction is implemented.",
-                severity=rule["severity"],
-                reference=rule["reference"]
-            )
+            return self._not_checked_result(rule, "Tactile floor guidance data not available in current IFC file. Will be checked when floor finish/guidance extraction is implemented.")
         
         if has_guidance:
-            return RuleResult(
-                rule_id=rule["id"],
-                rule_name=rule["name"],
-                status=RuleStatus.PASS,
-                details=f"Tactile floor guidance present. {rule.get('description_en', '')}",
-                severity=rule["severity"],
-                reference=rule["reference"]
+            return self._result_factories[rule.id](
+                RuleStatus.PASS,
+                f"Tactile floor guidance present. {rule.description_en}"
             )
-        return RuleResult(
-            rule_id=rule["id"],
-            rule_name=rule["name"],
-            status=RuleStatus.FAIL,
-            details="Tactile floor guidance required for visually impaired in this public area.",
-            severity=rule["severity"],
-            reference=rule["reference"]
+        return self._result_factories[rule.id](
+            RuleStatus.FAIL,
+            "Tactile floor guidance required for visually impaired in this public area."
         )
     
     def _validate_space_dict(self, space_dict: Dict[str, Any]) -> None:
@@ -1586,12 +2026,12 @@ class BFS2024ComplianceChecker:
         Raises:
             ValueError: If required fields are missing
         """
-        required_fields = ["id", "type"]
-        missing = [f for f in required_fields if f not in space_dict]
-        
-        if missing:
+        # Subset test first so the common (valid) case builds no new set
+        keys = space_dict.keys()
+        if not self._REQUIRED_SPACE_FIELDS <= keys:
+            missing = self._REQUIRED_SPACE_FIELDS - keys
             raise ValueError(
-                f"Space dictionary missing required fields: {missing}"
+                f"Space dictionary missing required fields: {sorted(missing)}"
             )
     
     def _calculate_min_space_width(self, boundary: List[List[float]]) -> float:
@@ -1610,12 +2050,23 @@ class BFS2024ComplianceChecker:
         if len(boundary) < 3:
             return 0.0
         
-        # Find bounding box dimensions
-        xs = [point[0] for point in boundary]
-        ys = [point[1] for point in boundary]
-        
-        width_x = max(xs) - min(xs)
-        width_y = max(ys) - min(ys)
+        # Find bounding box dimensions in one pass over the points
+        min_x = max_x = boundary[0][0]
+        min_y = max_y = boundary[0][1]
+        for point in boundary:
+            x = point[0]
+            y = point[1]
+            if x < min_x:
+                min_x = x
+            elif x > max_x:
+                max_x = x
+            if y < min_y:
+                min_y = y
+            elif y > max_y:
+                max_y = y
+        
+        width_x = max_x - min_x
+        width_y = max_y - min_y
         
         # Return minimum dimension
         return min(width_x, width_y)
@@ -1639,34 +2090,42 @@ class BFS2024ComplianceChecker:
         Returns:
             Overall compliance status
         """
-        # Check for errors first
-        if any(r.status == RuleStatus.ERROR for r in rule_results):
-            return OverallStatus.ERROR
-        
-        # Check for critical failures
-        critical_fails = [
-            r for r in rule_results 
-            if r.status == RuleStatus.FAIL and r.severity == Severity.CRITICAL
-        ]
-        if critical_fails:
+        # Enum member lookups go through the metaclass; bind them once
+        FAIL, NOT_CHECKED, ERROR = RuleStatus.FAIL, RuleStatus.NOT_CHECKED, RuleStatus.ERROR
+        CRITICAL, WARNING = Severity.CRITICAL, Severity.WARNING
+        
+        # ERROR outranks everything, so it ends the scan; a critical FAIL
+        # still has to look for a later ERROR
+        has_critical_fail = is_partial = False
+        for r in rule_results:
+            status = r.status
+            if status is ERROR:
+                return OverallStatus.ERROR
+            if status is FAIL:
+                if r.severity is CRITICAL:
+                    has_critical_fail = True
+                elif r.severity is WARNING:
+                    is_partial = True
+            elif status is NOT_CHECKED:
+                is_partial = True
+        
+        if has_critical_fail:
             return OverallStatus.FAIL
-        
-        # Check for not checked or warnings
-        has_not_checked = any(
-            r.status == RuleStatus.NOT_CHECKED for r in rule_results
-        )
-        has_warning_fails = any(
-            r.status == RuleStatus.FAIL and r.severity == Severity.WARNING 
-            for r in rule_results
-        )
-        
-        if has_not_checked or has_warning_fails:
+        if is_partial:
             return OverallStatus.PARTIAL
-        
-        # All applicable rules passed
         return OverallStatus.PASS
 
 
+# Status icon per rule line in the text report
+_STATUS_ICONS = {
+    RuleStatus.PASS: "✓",
+    RuleStatus.FAIL: "✗",
+    RuleStatus.NOT_APPLICABLE: "-",
+    RuleStatus.NOT_CHECKED: "?",
+    RuleStatus.ERROR: "!"
+}
+
+
 def generate_compliance_report(
     results: List[ComplianceResult], 
     include_passed: bool = True
@@ -1690,15 +2149,10 @@ def generate_compliance_report(
     lines.append("")
     
     # Summary statistics
-    passed_spaces = sum(
-        1 for r in results if r.overall_status == OverallStatus.PASS
-    )
-    failed_spaces = sum(
-        1 for r in results if r.overall_status == OverallStatus.FAIL
-    )
-    partial_spaces = sum(
-        1 for r in results if r.overall_status == OverallStatus.PARTIAL
-    )
+    status_counts = Counter(r.overall_status for r in results)
+    passed_spaces = status_counts[OverallStatus.PASS]
+    failed_spaces = status_counts[OverallStatus.FAIL]
+    partial_spaces = status_counts[OverallStatus.PARTIAL]
     
     lines.append("SUMMARY:")
     lines.append(f"  ✓ Passed: {passed_spaces}")
@@ -1717,24 +2171,17 @@ def generate_compliance_report(
         # Rule results
         for rule in result.rules_checked:
             # Skip passed rules if not including them
-            if not include_passed and rule.status == RuleStatus.PASS:
+            if not include_passed and rule.status is RuleStatus.PASS:
                 continue
             
-            # Status icon
-            icon = {
-                RuleStatus.PASS: "✓",
-                RuleStatus.FAIL: "✗",
-                RuleStatus.NOT_APPLICABLE: "-",
-                RuleStatus.NOT_CHECKED: "?",
-                RuleStatus.ERROR: "!"
-            }.get(rule.status, "?")
-            
-            lines.append(f"  {icon} {rule.rule_name}")
-            lines.append(f"    Reference: {rule.reference}")
-            lines.append(f"    Status: {rule.status.value}")
-            lines.append(f"    Severity: {rule.severity.value}")
-            lines.append(f"    Details: {rule.details}")
-            lines.append("")
+            icon = _STATUS_ICONS.get(rule.status, "?")
+            lines.append(
+                f"  {icon} {rule.rule_name}\n"
+                f"    Reference: {rule.reference}\n"
+                f"    Status: {_STATUS_VALUES[rule.status]}\n"
+                f"    Severity: {_SEVERITY_VALUES[rule.severity]}\n"
+                f"    Details: {rule.details}\n"
+            )
     
     lines.append("=" * 80)
     lines.append("END OF REPORT")
@@ -1760,11 +2207,43 @@ def export_results_json(
             "total_spaces": len(results),
             "standard": "BFS 2024:1"
         },
-        "results": [r.to_dict() for r in results]
+        "results": results
     }
     
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    with open(filepath, 'wb') as f:
+        f.write(dumps_json(data, indent=True))
+
+
+def export_results_jsonl(
+    results: Iterable[ComplianceResult],
+    filepath: str
+) -> None:
+    """
+    Export compliance results to a JSON Lines file, one space per line.
+    
+    The first line holds the report metadata (as in export_results_json,
+    without total_spaces so results can be any iterable, e.g. a generator);
+    each result is serialized and written on its own, so memory use does not
+    grow with the number of spaces.  Writes go through a 1 MiB buffer, so
+    the per-line writes reach the OS as a few large ones.
+    
+    Args:
+        results: ComplianceResult objects
+        filepath: Path to output .jsonl file
+    """
+    metadata = {
+        "report_metadata": {
+            "generated": datetime.now().isoformat(),
+            "standard": "BFS 2024:1"
+        }
+    }
+    
+    with open(filepath, 'wb', buffering=1 << 20) as f:
+        f.write(dumps_json(metadata))
+        f.write(b"\n")
+        for result in results:
+            f.write(dumps_json(result))
+            f.write(b"\n")
 
 
 # ============================================================================
@@ -1773,6 +2252,18 @@ def export_results_json(
 
 def run_tests():
     """Run comprehensive tests of the compliance checker"""
+    # The reports are long; collect the output and write it to the console
+    # once (also when a test raises) instead of line by line
+    buffer = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buffer):
+            _run_tests()
+    finally:
+        sys.stdout.write(buffer.getvalue())
+
+
+def _run_tests():
+    """Body of run_tests, printing to sys.stdout"""
     print("Running BFS 2024:1 Compliance Checker Tests")
     print("=" * 80)
     
@@ -1900,11 +2391,86 @@ def run_tests():
     export_results_json(all_results, json_path)
     print(f"Results exported to: {json_path}")
     
+    # Test 7: Vectorized checks agree with check_compliance_batch
+    print("\nTest 7: Vectorized checks agree with check_compliance_batch")
+    print("-" * 80)
+    
+    if np is None:
+        print("Skipped: numpy is not installed")
+    else:
+        many_spaces = [
+            space_pass, space_fail, space_kitchen, space_missing, space_narrow,
+            {"id": "space_006", "name": "Corridor", "type": "corridor",
+             "corridor_width_mm": 1200, "handrail_height_mm": 950},
+            {"id": "space_007", "name": "Ramp", "type": "ramp",
+             "ramp_slope_ratio": 0.05, "handrail_height_mm": 1100},
+            {"id": "space_008", "name": "Elevator", "type": "elevator",
+             "elevator_width_mm": 1100, "elevator_depth_mm": 1400,
+             "elevator_door_width_mm": 800},
+            {"id": "space_009", "name": "Stair", "type": "stair",
+             "stair_rise_mm": 170, "stair_run_mm": 280, "stair_width_mm": 1000,
+             "stair_handrail_both_sides": False},
+            {"id": "space_010", "name": "Parking", "type": "parking",
+             "parking_width_mm": 5000, "parking_length_mm": 4800},
+            {"id": "space_011", "name": "Exit", "type": "emergency_exit",
+             "emergency_exit_width_mm": 900,
+             "emergency_exit_door_opens_outward": True},
+        ]
+        many_geometry = [
+            geometry_pass, geometry_fail, None, None, geometry_narrow,
+            None, None, None, None, None, None,
+        ]
+        
+        expected = checker.check_compliance_batch(many_spaces, many_geometry)
+        many = checker.check_compliance_many(many_spaces, many_geometry)
+        compact = checker.validate_compact(many_spaces, many_geometry)
+        counts = checker.status_counts_many(many_spaces, many_geometry)
+        
+        expected_counts = {status: 0 for status in RuleStatus}
+        for i, (result, vectorized) in enumerate(zip(expected, many)):
+            assert replace(vectorized, timestamp=result.timestamp) == result, result.space_id
+            for j, rule_result in enumerate(result.rules_checked):
+                assert compact.status(i, j) is rule_result.status, (result.space_id, j)
+                assert compact.materialize(i, j) == rule_result, (result.space_id, j)
+                expected_counts[rule_result.status] += 1
+        assert counts == expected_counts, counts
+        
+        # NaN inputs count as missing, mixed with absent and None values
+        missing_spaces = [
+            {"id": "space_012", "name": "NaN Corridor", "type": "corridor",
+             "corridor_width_mm": math.nan},
+            {"id": "space_013", "name": "Bare Corridor", "type": "corridor"},
+            {"id": "space_014", "name": "NaN Elevator", "type": "elevator",
+             "elevator_width_mm": math.nan, "elevator_depth_mm": None},
+        ]
+        missing_expected = checker.check_compliance_batch(
+            [missing_spaces[1], {"id": "space_015", "type": "elevator"}]
+        )
+        missing_many = checker.check_compliance_many(missing_spaces)
+        missing_compact = checker.validate_compact(missing_spaces)
+        for i, result in enumerate(missing_many):
+            reference = missing_expected[0 if i < 2 else 1]
+            assert result.rules_checked == reference.rules_checked, result.space_id
+            assert result.not_checked_count == reference.not_checked_count, result.space_id
+            for j, rule_result in enumerate(reference.rules_checked):
+                assert missing_compact.materialize(i, j) == rule_result, (result.space_id, j)
+        missing_counts = checker.status_counts_many(missing_spaces)
+        assert missing_counts[RuleStatus.FAIL] == 0, missing_counts
+        assert missing_counts[RuleStatus.NOT_CHECKED] == sum(
+            r.not_checked_count for r in missing_many
+        ), missing_counts
+        
+        print(
+            f"check_compliance_many, validate_compact and status_counts_many "
+            f"match check_compliance_batch for {len(many_spaces)} spaces, "
+            f"with NaN inputs counted as missing"
+        )
+    
     # Summary
     print("\n" + "=" * 80)
     print("TEST SUMMARY")
     print("=" * 80)
-    print(f"Total tests run: 6")
+    print(f"Total tests run: 7")
     print(f"All tests completed successfully")
     print("\nTest Coverage:")
     print("  ✓ Passing bathroom")
@@ -1913,6 +2479,7 @@ def run_tests():
     print("  ✓ Non-applicable space type")
     print("  ✓ Missing geometry data")
     print("  ✓ JSON export")
+    print("  ✓ Vectorized checks")
 
 
 if __name__ == "__main__":
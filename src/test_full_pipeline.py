@@ -31,11 +31,7 @@ def main():
     
     # Step 3: Check compliance rules
     print("Step 3: Running BFS 2024:1 compliance checks...")
-    compliance_results = []
-    for i, space in enumerate(spaces):
-        geometry_result = geometry_results[i]
-        compliance_result = checker.check_compliance(space, geometry_result)
-        compliance_results.append(compliance_result)
+    compliance_results = checker.check_compliance_batch(spaces, geometry_results)
     
     print(f"✓ Compliance checks complete")
     print()